@@ -0,0 +1,126 @@
+# accounts/admin.py
+
+from django.contrib import admin
+from django.contrib.auth.admin import UserAdmin
+from django.contrib.auth.forms import UserChangeForm, UserCreationForm
+from django.db.models import QuerySet
+from django.http import HttpRequest
+from sbxt_accounts.models import AccountProfile, CustomAccount
+
+
+class CustomAccountCreationForm(UserCreationForm):
+    """CustomAccountCreationForm
+
+    Admin add form for :class:`sbxt_accounts.models.CustomAccount` that
+    hashes the entered password.
+    """
+
+    class Meta(UserCreationForm.Meta):
+        model = CustomAccount
+        fields: tuple[str, ...] = ("username",)
+
+
+class CustomAccountChangeForm(UserChangeForm):
+    """CustomAccountChangeForm
+
+    Admin change form for :class:`sbxt_accounts.models.CustomAccount`. The
+    password is shown as its read-only hash with a link to the password
+    change view.
+    """
+
+    class Meta(UserChangeForm.Meta):
+        model = CustomAccount
+
+
+@admin.register(CustomAccount)
+class CustomAccountAdmin(UserAdmin):
+    """CustomAccountAdmin
+
+    Admin for :class:`sbxt_accounts.models.CustomAccount`, built on
+    Django's :class:`~django.contrib.auth.admin.UserAdmin` so passwords are
+    only ever set through the hashing add form and password change view.
+
+    The changelist reads status, group and permission summaries from
+    :meth:`sbxt_accounts.models.account_models.CustomAccountQuerySet.with_summaries`
+    so it runs the same number of queries whatever the page size.
+    """
+
+    form = CustomAccountChangeForm
+    add_form = CustomAccountCreationForm
+
+    list_display: tuple[str, ...] = (
+        "username",
+        "status_display",
+        "is_staff",
+        "is_superuser",
+        "group_count_display",
+        "permission_count_display",
+        "date_joined",
+        "last_login",
+    )
+    list_filter: tuple[str, ...] = ("is_active", "is_staff", "is_superuser", "groups")
+    search_fields: tuple[str, ...] = ("username",)
+    ordering: tuple[str, ...] = ("username",)
+    filter_horizontal: tuple[str, ...] = ("groups", "user_permissions")
+    readonly_fields: tuple[str, ...] = ("date_joined", "last_login")
+    fieldsets: tuple = (
+        (None, {"fields": ("username", "password")}),
+        ("status", {"fields": ("is_active", "is_of_age")}),
+        (
+            "permissions",
+            {"fields": ("is_staff", "is_superuser", "groups", "user_permissions")},
+        ),
+        ("dates", {"fields": ("date_joined", "last_login")}),
+    )
+    add_fieldsets: tuple = (
+        (
+            None,
+            {
+                "classes": ("wide",),
+                "fields": ("username", "password1", "password2"),
+            },
+        ),
+    )
+
+    def get_queryset(self, request: HttpRequest) -> QuerySet:
+        return super().get_queryset(request).with_summaries()
+
+    @admin.display(description="status", ordering="status_label")
+    def status_display(self, obj: CustomAccount) -> str:
+        return obj.status_label
+
+    @admin.display(description="groups", ordering="group_count")
+    def group_count_display(self, obj: CustomAccount) -> int:
+        return obj.group_count
+
+    @admin.display(description="permissions", ordering="permission_count")
+    def permission_count_display(self, obj: CustomAccount) -> str:
+        return f"{obj.permission_count} direct, {obj.group_permission_count} via groups"
+
+
+@admin.register(AccountProfile)
+class AccountProfileAdmin(admin.ModelAdmin):
+    """AccountProfileAdmin
+
+    Admin for :class:`sbxt_accounts.models.AccountProfile`. The account is
+    joined into the changelist query.
+    """
+
+    list_display: tuple[str, ...] = (
+        "user",
+        "get_full_name",
+        "email",
+        "phone",
+        "is_public",
+    )
+    list_filter: tuple[str, ...] = ("is_public",)
+    list_select_related: tuple[str, ...] = ("user",)
+    search_fields: tuple[str, ...] = (
+        "user__username",
+        "first_name",
+        "last_name",
+        "email_canonical",
+        "phone_e164",
+    )
+    readonly_fields: tuple[str, ...] = ("slug", "phone_e164", "email_canonical")
+    raw_id_fields: tuple[str, ...] = ("user",)
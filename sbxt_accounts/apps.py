@@ -14,3 +14,20 @@ class AccountsConfig(AppConfig):
     name: str = "sbxt_accounts"  #: app name
     verbose_name: str = "accounts"  #: app plural name
     label: str = "accounts"  #: app label
+
+    def ready(self) -> None:
+        """connect the change outbox and login history receivers"""
+        from django.conf import settings
+        from django.contrib.auth.signals import user_logged_in, user_logged_out
+        from django.db.models.signals import post_delete, post_save
+        from sbxt_accounts.login_history import record_login, record_logout
+        from sbxt_accounts.models import AccountProfile, CustomAccount
+        from sbxt_accounts.signals import record_delete, record_save
+
+        for model in (CustomAccount, AccountProfile):
+            post_save.connect(record_save, sender=model)
+            post_delete.connect(record_delete, sender=model)
+
+        if getattr(settings, "LOGIN_HISTORY_ENABLED", True):
+            user_logged_in.connect(record_login)
+            user_logged_out.connect(record_logout)
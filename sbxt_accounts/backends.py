@@ -0,0 +1,92 @@
+# accounts/backends.py
+
+from typing import Optional
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+from django.core.exceptions import PermissionDenied
+from django.http import HttpRequest
+from sbxt_accounts.throttling import SlidingWindow, get_client_ip
+from sbxt_accounts.utils import normalize_username
+
+UserModel = get_user_model()
+
+
+class ThrottledModelBackend(ModelBackend):
+    """ThrottledModelBackend
+
+    Authenticates against :class:`sbxt_accounts.models.CustomAccount` after
+    charging the per-username and per-address rate limits.
+
+    Throttled attempts are rejected before the account is looked up or any
+    password is hashed. Successful logins are given back to the username
+    limit, so only failed attempts count against it. Every attempt that gets through runs exactly one
+    password hash: the account's own for known usernames (active or not)
+    and Django's dummy hash for unknown ones, so response times do not
+    reveal which usernames exist.
+
+    Add it to settings in place of the default backend::
+
+        AUTHENTICATION_BACKENDS: list[str] = [
+            "sbxt_accounts.backends.ThrottledModelBackend",
+        ]
+
+    Raises:
+        PermissionDenied: the username or address is throttled
+    """
+
+    def authenticate(
+        self,
+        request: Optional[HttpRequest],
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        **kwargs,
+    ) -> Optional[UserModel]:
+        if username is None:
+            username = kwargs.get(UserModel.USERNAME_FIELD)
+        if username is None or password is None:
+            return None
+
+        username: str = normalize_username(username)
+        window: Optional[SlidingWindow] = self._charge(request, username)
+        if window is None:
+            raise PermissionDenied
+
+        try:
+            user: UserModel = UserModel._default_manager.get_by_natural_key(username)
+        except UserModel.DoesNotExist:
+            # run the default password hasher to keep timing constant
+            UserModel().set_password(password)
+            return None
+        if user.check_password(password) and self.user_can_authenticate(user):
+            window.refund()
+            return user
+        return None
+
+    def allow_attempt(self, request: Optional[HttpRequest], username: str) -> bool:
+        """allow_attempt
+
+        Counts the attempt against the username limit and, unless
+        :class:`sbxt_accounts.middleware.LoginThrottleMiddleware` already
+        did, the address limit.
+
+        Args:
+            request (HttpRequest | None): the current request
+            username (str): the normalized username
+
+        Returns:
+            bool: `True` if the attempt may go ahead
+        """
+        return self._charge(request, username) is not None
+
+    def _charge(
+        self, request: Optional[HttpRequest], username: str
+    ) -> Optional[SlidingWindow]:
+        """charge the limits, returning the username window if allowed"""
+        if request is not None and not getattr(
+            request, "login_throttle_checked", False
+        ):
+            ip: Optional[str] = get_client_ip(request)
+            if ip and not SlidingWindow("ip", ip).consume():
+                return None
+        window: SlidingWindow = SlidingWindow("username", username)
+        return window if window.consume() else None
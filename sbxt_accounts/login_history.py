@@ -0,0 +1,289 @@
+"""accounts/login_history.py
+
+Buffered login and logout history.
+
+Login signals only append to an in-memory buffer. The buffer is split into
+shards by session key so concurrent requests rarely wait on the same lock,
+and it is flushed as one batched insert into :class:`LoginEvent` plus one
+update per (account, day) to :class:`LoginRollup` once it holds
+`LOGIN_HISTORY_MAX_EVENTS` events or its oldest event is
+`LOGIN_HISTORY_MAX_AGE` seconds old. Reads go to the daily rollups and
+pruning drops whole days.
+
+Both limits are only checked when an event is recorded, so a worker that
+sees no further logins keeps its events until the next one arrives or
+``buffer.flush()`` is called. Events still in a buffer when a process
+exits are lost; call ``buffer.flush()`` from the worker's shutdown hook to
+keep them.
+
+A flush never runs inside the transaction of the request that fills the
+buffer. If that request is in an atomic block, for example with
+``ATOMIC_REQUESTS``, the flush waits until the block commits, and if the
+block rolls back the events simply stay buffered.
+
+Settings::
+
+    LOGIN_HISTORY_ENABLED: bool = True
+    LOGIN_HISTORY_SHARDS: int = 8
+    LOGIN_HISTORY_MAX_EVENTS: int = 500
+    LOGIN_HISTORY_MAX_AGE: float = 5.0
+"""
+
+import datetime
+import threading
+import time
+import zlib
+from collections import Counter
+from typing import Optional
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F, Sum
+from django.http import HttpRequest
+from django.utils import timezone
+from sbxt_accounts.models import LoginEvent, LoginRollup
+from sbxt_accounts.throttling import get_client_ip
+
+
+class _Shard:
+    """one lock and event list of a :class:`LoginHistoryBuffer`"""
+
+    __slots__ = ("lock", "events")
+
+    def __init__(self) -> None:
+        self.lock: threading.Lock = threading.Lock()
+        self.events: list[LoginEvent] = []
+
+
+class LoginHistoryBuffer:
+    """LoginHistoryBuffer
+
+    Collects :class:`LoginEvent` instances in memory and writes them in
+    batches.
+
+    Args:
+        shards (int): number of independently locked event lists
+        max_events (int): flush once this many events are buffered
+        max_age (float): flush at the next event once the oldest buffered
+            event is this many seconds old
+    """
+
+    def __init__(
+        self,
+        shards: int = 8,
+        max_events: int = 500,
+        max_age: float = 5.0,
+    ) -> None:
+        self.shards: list[_Shard] = [_Shard() for _ in range(shards)]
+        self.max_events: int = max_events
+        self.max_age: float = max_age
+        self._oldest: Optional[float] = None
+        self._flush_lock: threading.Lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return sum(len(s.events) for s in self.shards)
+
+    def record(
+        self,
+        username: str,
+        action: str,
+        session_key: str = "",
+        ip: Optional[str] = None,
+        timestamp: Optional[datetime.datetime] = None,
+    ) -> None:
+        """record
+
+        Buffers one event and flushes the buffer if it is due.
+
+        Args:
+            username (str): account username
+            action (str): :attr:`LoginEvent.LOGIN` or `LOGOUT`
+            session_key (str): session key, also picks the shard
+            ip (str | None): client address
+            timestamp (datetime | None): time of the event, defaults to now
+        """
+        timestamp: datetime.datetime = timestamp or timezone.now()
+        event: LoginEvent = LoginEvent(
+            username=username,
+            action=action,
+            session_key=session_key or "",
+            ip=ip,
+            timestamp=timestamp,
+            day=(
+                timestamp.astimezone(datetime.timezone.utc).date()
+                if timezone.is_aware(timestamp)
+                else timestamp.date()
+            ),
+        )
+        shard: _Shard = self._shard(event)
+        with shard.lock:
+            shard.events.append(event)
+        if self._oldest is None:
+            self._oldest = time.monotonic()
+        if self.due():
+            # runs now outside a transaction, after commit inside one, and
+            # not at all if the caller's transaction rolls back
+            transaction.on_commit(self.flush, robust=True)
+
+    def _shard(self, event: LoginEvent) -> _Shard:
+        key: str = event.session_key or event.username
+        return self.shards[zlib.crc32(key.encode("utf-8")) % len(self.shards)]
+
+    def due(self) -> bool:
+        """due
+
+        Returns:
+            bool: `True` if the buffer should be flushed
+        """
+        if len(self) >= self.max_events:
+            return True
+        return (
+            self._oldest is not None and time.monotonic() - self._oldest >= self.max_age
+        )
+
+    def flush(self) -> int:
+        """flush
+
+        Writes every buffered event with one ``bulk_create`` and adds them
+        to the daily rollups, all in one durable transaction. If the write
+        fails the events are put back in the buffer.
+
+        Raises:
+            RuntimeError: called inside an atomic block
+
+        Returns:
+            int: number of events written
+        """
+        with self._flush_lock:
+            events: list[LoginEvent] = []
+            for shard in self.shards:
+                with shard.lock:
+                    events += shard.events
+                    shard.events = []
+            self._oldest = None
+            if not events:
+                return 0
+
+            counts: Counter = Counter((e.username, e.day, e.action) for e in events)
+            days: set[tuple[str, datetime.date]] = {(u, d) for u, d, _ in counts}
+            try:
+                with transaction.atomic(durable=True):
+                    LoginEvent.objects.bulk_create(events)
+                    LoginRollup.objects.bulk_create(
+                        [LoginRollup(username=u, day=d) for u, d in days],
+                        ignore_conflicts=True,
+                    )
+                    for u, d in days:
+                        LoginRollup.objects.filter(username=u, day=d).update(
+                            logins=F("logins") + counts[(u, d, LoginEvent.LOGIN)],
+                            logouts=F("logouts") + counts[(u, d, LoginEvent.LOGOUT)],
+                        )
+            except BaseException:
+                self._restore(events)
+                raise
+            return len(events)
+
+    def _restore(self, events: list[LoginEvent]) -> None:
+        """put events from a failed flush back in their shards"""
+        for event in events:
+            event.pk = None
+            event._state.adding = True
+            shard: _Shard = self._shard(event)
+            with shard.lock:
+                shard.events.append(event)
+        if self._oldest is None:
+            self._oldest = time.monotonic()
+
+
+buffer: LoginHistoryBuffer = LoginHistoryBuffer(
+    shards=getattr(settings, "LOGIN_HISTORY_SHARDS", 8),
+    max_events=getattr(settings, "LOGIN_HISTORY_MAX_EVENTS", 500),
+    max_age=getattr(settings, "LOGIN_HISTORY_MAX_AGE", 5.0),
+)  #: the process wide buffer used by the login signal receivers
+
+
+def record_login(sender, request: Optional[HttpRequest], user, **kwargs) -> None:
+    """record_login
+
+    ``user_logged_in`` receiver that buffers a login event
+    """
+    _record(request, user, LoginEvent.LOGIN)
+
+
+def record_logout(sender, request: Optional[HttpRequest], user, **kwargs) -> None:
+    """record_logout
+
+    ``user_logged_out`` receiver that buffers a logout event
+    """
+    if user is not None:
+        _record(request, user, LoginEvent.LOGOUT)
+
+
+def _record(request: Optional[HttpRequest], user, action: str) -> None:
+    session = getattr(request, "session", None)
+    buffer.record(
+        user.get_username(),
+        action,
+        session_key=getattr(session, "session_key", None) or "",
+        ip=get_client_ip(request) if request is not None else None,
+    )
+
+
+def recent_activity(username: str, days: int = 30) -> list[dict]:
+    """recent_activity
+
+    Reads an account's daily counts from the rollups. Events still in a
+    buffer are not included.
+
+    Args:
+        username (str): account username
+        days (int): number of days to include, counting today
+
+    Returns:
+        list[dict]: ``{"day", "logins", "logouts"}`` for each day with
+        activity, newest first
+    """
+    since: datetime.date = timezone.now().date() - datetime.timedelta(days=days - 1)
+    return list(
+        LoginRollup.objects.filter(username=username, day__gte=since)
+        .order_by("-day")
+        .values("day", "logins", "logouts")
+    )
+
+
+def activity_totals(username: str, days: int = 30) -> dict[str, int]:
+    """activity_totals
+
+    Args:
+        username (str): account username
+        days (int): number of days to include, counting today
+
+    Returns:
+        dict[str, int]: total ``logins`` and ``logouts`` over `days`
+    """
+    since: datetime.date = timezone.now().date() - datetime.timedelta(days=days - 1)
+    totals: dict = LoginRollup.objects.filter(
+        username=username, day__gte=since
+    ).aggregate(logins=Sum("logins"), logouts=Sum("logouts"))
+    return {k: v or 0 for k, v in totals.items()}
+
+
+def prune(event_days: int = 90, rollup_days: int = 730) -> tuple[int, int]:
+    """prune
+
+    Drops whole days of events and rollups that are past retention.
+
+    Args:
+        event_days (int): days of raw events to keep
+        rollup_days (int): days of rollups to keep
+
+    Returns:
+        tuple[int, int]: deleted events and deleted rollups
+    """
+    today: datetime.date = timezone.now().date()
+    events: int = LoginEvent.objects.filter(
+        day__lt=today - datetime.timedelta(days=event_days)
+    ).delete()[0]
+    rollups: int = LoginRollup.objects.filter(
+        day__lt=today - datetime.timedelta(days=rollup_days)
+    ).delete()[0]
+    return events, rollups
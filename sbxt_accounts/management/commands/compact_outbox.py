@@ -0,0 +1,39 @@
+# accounts/management/commands/compact_outbox.py
+
+from datetime import timedelta
+from django.core.management.base import BaseCommand, CommandParser
+from sbxt_accounts.outbox import compact, prune
+
+
+class Command(BaseCommand):
+    """compact_outbox
+
+    Drops superseded change events and prunes events every consumer has
+    acknowledged once they are older than the retention period.
+
+    Example::
+
+        python manage.py compact_outbox --retention-days 7
+    """
+
+    help: str = "Compact and prune the change outbox"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--retention-days",
+            type=float,
+            default=7,
+            help="keep acknowledged events for this many days",
+        )
+        parser.add_argument(
+            "--no-compact",
+            action="store_true",
+            help="only prune, keep superseded events",
+        )
+
+    def handle(self, *args, **options) -> None:
+        compacted: int = 0 if options["no_compact"] else compact()
+        pruned: int = prune(timedelta(days=options["retention_days"]))
+        self.stdout.write(
+            self.style.SUCCESS(f"compacted {compacted} events, pruned {pruned} events")
+        )
@@ -0,0 +1,64 @@
+# accounts/management/commands/consume_outbox.py
+
+import json
+from datetime import timedelta
+from django.core.management.base import BaseCommand, CommandParser
+from sbxt_accounts.models import ChangeEvent
+from sbxt_accounts.outbox import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_GAP_TIMEOUT,
+    OutboxConsumer,
+)
+
+
+class Command(BaseCommand):
+    """consume_outbox
+
+    Streams pending account and profile change events as JSON lines and
+    moves the consumer's high-water mark past each batch written.
+
+    Examples::
+
+        python manage.py consume_outbox search-index > changes.jsonl
+        python manage.py consume_outbox search-index --max-batches 10
+    """
+
+    help: str = "Stream pending change outbox events as JSON lines"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument("consumer", help="consumer name")
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help="events read per batch",
+        )
+        parser.add_argument(
+            "--max-batches",
+            type=int,
+            default=None,
+            help="stop after this many batches",
+        )
+        parser.add_argument(
+            "--gap-timeout",
+            type=float,
+            default=DEFAULT_GAP_TIMEOUT.total_seconds(),
+            help="seconds to wait for a missing event id to commit",
+        )
+
+    def handle(self, *args, **options) -> None:
+        consumer: OutboxConsumer = OutboxConsumer(
+            options["consumer"],
+            batch_size=options["batch_size"],
+            gap_timeout=timedelta(seconds=options["gap_timeout"]),
+        )
+        batches: int = 0
+        while options["max_batches"] is None or batches < options["max_batches"]:
+            events: list[ChangeEvent] = consumer.read()
+            if not events:
+                break
+            for e in events:
+                self.stdout.write(json.dumps(e.as_dict()))
+            self.stdout.flush()
+            consumer.ack(events)
+            batches += 1
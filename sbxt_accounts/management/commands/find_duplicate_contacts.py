@@ -0,0 +1,46 @@
+# accounts/management/commands/find_duplicate_contacts.py
+
+import json
+from django.core.management.base import BaseCommand, CommandParser
+from sbxt_accounts.models import AccountProfile
+
+
+class Command(BaseCommand):
+    """find_duplicate_contacts
+
+    Streams clusters of profiles that share a normalized phone number or
+    email address as JSON lines.
+
+    Examples::
+
+        python manage.py find_duplicate_contacts
+        python manage.py find_duplicate_contacts --field phone > phones.jsonl
+    """
+
+    help: str = "Report profiles that share a phone number or email address"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--field",
+            choices=sorted(AccountProfile.objects.CONTACT_FIELDS),
+            action="append",
+            help="contact field to check, defaults to all of them",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=2000,
+            help="rows fetched per round trip",
+        )
+
+    def handle(self, *args, **options) -> None:
+        clusters: int = 0
+        for field in options["field"] or sorted(AccountProfile.objects.CONTACT_FIELDS):
+            for value, usernames in AccountProfile.objects.duplicate_clusters(
+                field, chunk_size=options["chunk_size"]
+            ):
+                self.stdout.write(
+                    json.dumps({"field": field, "value": value, "profiles": usernames})
+                )
+                clusters += 1
+        self.stderr.write(f"{clusters} duplicate clusters")
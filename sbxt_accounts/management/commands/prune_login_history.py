@@ -0,0 +1,42 @@
+# accounts/management/commands/prune_login_history.py
+
+from django.core.management.base import BaseCommand, CommandParser
+from sbxt_accounts import login_history
+
+
+class Command(BaseCommand):
+    """prune_login_history
+
+    Drops whole days of login events and daily rollups that are past
+    their retention period. Events still buffered in running workers are
+    not affected; they are written by those workers.
+
+    Example::
+
+        python manage.py prune_login_history --event-days 90 --rollup-days 730
+    """
+
+    help: str = "Delete login history past its retention period"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--event-days",
+            type=int,
+            default=90,
+            help="days of raw login events to keep",
+        )
+        parser.add_argument(
+            "--rollup-days",
+            type=int,
+            default=730,
+            help="days of daily rollups to keep",
+        )
+
+    def handle(self, *args, **options) -> None:
+        events, rollups = login_history.prune(
+            event_days=options["event_days"],
+            rollup_days=options["rollup_days"],
+        )
+        self.stdout.write(
+            self.style.SUCCESS(f"pruned {events} login events and {rollups} rollups")
+        )
@@ -0,0 +1,97 @@
+# accounts/management/commands/publish_password_list.py
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from sbxt_accounts.password_store import (
+    PasswordListStore,
+    read_password_file,
+)
+
+
+class Command(BaseCommand):
+    """publish_password_list
+
+    Compiles a common passwords list into a new generation of the
+    `COMMON_PASSWORDS_STORE` and makes it live. Running processes pick the
+    new generation up on their next check without a restart.
+
+    Examples::
+
+        python manage.py publish_password_list passwords.txt.gz
+        python manage.py publish_password_list --add new.txt --remove old.txt
+    """
+
+    help: str = "Publish a new generation of the common passwords list store"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "source",
+            nargs="?",
+            help="full password list (plain text or gzipped) to publish",
+        )
+        parser.add_argument(
+            "--add",
+            action="append",
+            default=[],
+            help="password list to add to the live generation",
+        )
+        parser.add_argument(
+            "--remove",
+            action="append",
+            default=[],
+            help="password list to remove from the live generation",
+        )
+        parser.add_argument(
+            "--store",
+            default=getattr(settings, "COMMON_PASSWORDS_STORE", None),
+            help="store directory, defaults to settings.COMMON_PASSWORDS_STORE",
+        )
+        parser.add_argument(
+            "--shards",
+            type=int,
+            default=None,
+            help="number of shards for a full publish",
+        )
+        parser.add_argument(
+            "--keep",
+            type=int,
+            default=2,
+            help="number of generations to keep on disk",
+        )
+
+    def handle(self, *args, **options) -> None:
+        if not options["store"]:
+            raise CommandError("set COMMON_PASSWORDS_STORE or pass --store")
+        if not options["source"] and not (options["add"] or options["remove"]):
+            raise CommandError("pass a source list or at least one --add/--remove")
+        if options["source"] and (options["add"] or options["remove"]):
+            raise CommandError("a full source list cannot be combined with a delta")
+
+        store: PasswordListStore = PasswordListStore(options["store"])
+        try:
+            if options["source"]:
+                manifest: dict = store.publish(
+                    read_password_file(options["source"]),
+                    shard_count=options["shards"],
+                )
+            else:
+                add: set[str] = set().union(*map(read_password_file, options["add"]))
+                remove: set[str] = set().union(
+                    *map(read_password_file, options["remove"])
+                )
+                manifest: dict = store.publish_delta(add=add, remove=remove)
+            removed: list[str] = store.prune(keep=options["keep"])
+        except (OSError, ValueError) as e:
+            raise CommandError(str(e)) from e
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                "published generation {generation}: {count} passwords "
+                "in {shards} shards ({removed} stale files removed)".format(
+                    generation=manifest["generation"],
+                    count=manifest["count"],
+                    shards=len(manifest["shards"]),
+                    removed=len(removed),
+                )
+            )
+        )
@@ -0,0 +1,72 @@
+# accounts/management/commands/purge_accounts.py
+
+from django.core.management.base import BaseCommand, CommandError, CommandParser
+from sbxt_accounts.purge import PurgeEngine, PurgeReport
+
+
+class Command(BaseCommand):
+    """purge_accounts
+
+    Archives and deletes accounts that have been inactive for a number of
+    days, in bounded batches with a pause between them.
+
+    Examples::
+
+        python manage.py purge_accounts --inactive-days 730 --dry-run
+        python manage.py purge_accounts --inactive-days 730 --batch-size 200
+        python manage.py purge_accounts --archive-file archive.jsonl.gz
+    """
+
+    help: str = "Archive and delete long inactive accounts in batches"
+
+    def add_arguments(self, parser: CommandParser) -> None:
+        parser.add_argument(
+            "--inactive-days",
+            type=int,
+            default=365,
+            help="days without a login before an inactive account is purged",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=100,
+            help="accounts deleted per transaction",
+        )
+        parser.add_argument(
+            "--pause",
+            type=float,
+            default=0.5,
+            help="seconds to sleep between batches",
+        )
+        parser.add_argument(
+            "--archive-file",
+            default=None,
+            help="append gzipped JSON lines here instead of the archive table",
+        )
+        parser.add_argument(
+            "--no-archive",
+            action="store_true",
+            help="delete without archiving",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="only report what would be deleted",
+        )
+
+    def handle(self, *args, **options) -> None:
+        try:
+            engine: PurgeEngine = PurgeEngine(
+                inactive_days=options["inactive_days"],
+                batch_size=options["batch_size"],
+                pause=options["pause"],
+                archive=not options["no_archive"],
+                archive_file=options["archive_file"],
+                dry_run=options["dry_run"],
+                progress=lambda r: self.stdout.write(str(r)),
+            )
+        except ValueError as e:
+            raise CommandError(str(e)) from e
+
+        report: PurgeReport = engine.run()
+        self.stdout.write(self.style.SUCCESS(str(report)))
@@ -0,0 +1,47 @@
+# accounts/middleware.py
+
+from typing import Callable, Optional
+from django.conf import settings
+from django.http import HttpRequest, HttpResponse
+from sbxt_accounts.throttling import SlidingWindow, get_client_ip
+
+
+class LoginThrottleMiddleware:
+    """LoginThrottleMiddleware
+
+    Rejects ``POST`` requests to `LOGIN_THROTTLE_PATHS` with a
+    ``429 Too Many Requests`` response once the client's address goes over
+    its limit, before the view touches the database or hashes a password.
+
+    Add it to settings ahead of the session and authentication middleware::
+
+        MIDDLEWARE: list[str] = [
+            "sbxt_accounts.middleware.LoginThrottleMiddleware",
+            ...,
+        ]
+        LOGIN_THROTTLE_PATHS: list[str] = ["/accounts/login/", "/accounts/signup/"]
+
+    Args:
+        get_response (Callable): the next middleware or view
+    """
+
+    def __init__(self, get_response: Callable[[HttpRequest], HttpResponse]) -> None:
+        self.get_response: Callable[[HttpRequest], HttpResponse] = get_response
+        self.paths: frozenset[str] = frozenset(
+            getattr(settings, "LOGIN_THROTTLE_PATHS", [])
+        )
+
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        if request.method == "POST" and request.path in self.paths:
+            ip: Optional[str] = get_client_ip(request)
+            if ip:
+                limit: SlidingWindow = SlidingWindow("ip", ip)
+                if not limit.consume():
+                    response: HttpResponse = HttpResponse(
+                        "Too many requests", status=429
+                    )
+                    response["Retry-After"] = str(limit.retry_after())
+                    return response
+            # tells ThrottledModelBackend the address was already charged
+            request.login_throttle_checked = True
+        return self.get_response(request)
@@ -0,0 +1,197 @@
+# Generated by Django 5.2.18 on 2026-10-19 04:19
+
+import django.core.validators
+import django.db.models.deletion
+import django.utils.timezone
+import phonenumber_field.modelfields
+import sbxt_accounts.utils.model_utils
+import sbxt_accounts.validators
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ("auth", "0012_alter_user_first_name_max_length"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CustomAccount",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("password", models.CharField(max_length=128, verbose_name="password")),
+                (
+                    "username",
+                    models.CharField(
+                        help_text="usernames must be between 8 and 20 characters long and contain only letters, numbers, periods (.), and underscores (_)",
+                        max_length=20,
+                        unique=True,
+                        validators=[sbxt_accounts.validators.UsernameValidator()],
+                    ),
+                ),
+                (
+                    "is_staff",
+                    models.BooleanField(
+                        default=False, help_text="grants access to the admin site"
+                    ),
+                ),
+                (
+                    "is_superuser",
+                    models.BooleanField(
+                        default=False,
+                        help_text="grants unrestricted access to everything",
+                    ),
+                ),
+                (
+                    "is_active",
+                    models.BooleanField(default=True, help_text="grants login access"),
+                ),
+                (
+                    "is_of_age",
+                    models.BooleanField(
+                        default=False, help_text="is old enough to use the app"
+                    ),
+                ),
+                (
+                    "date_joined",
+                    models.DateTimeField(
+                        default=django.utils.timezone.now,
+                        help_text="date and time the user was added to the site",
+                    ),
+                ),
+                (
+                    "last_login",
+                    models.DateTimeField(
+                        blank=True, null=True, verbose_name="last_login"
+                    ),
+                ),
+                (
+                    "groups",
+                    models.ManyToManyField(
+                        blank=True,
+                        help_text="The groups this user belongs to. A user will get all permissions granted to each of their groups.",
+                        related_name="user_set",
+                        related_query_name="user",
+                        to="auth.group",
+                        verbose_name="groups",
+                    ),
+                ),
+                (
+                    "user_permissions",
+                    models.ManyToManyField(
+                        blank=True,
+                        help_text="Specific permissions for this user.",
+                        related_name="user_set",
+                        related_query_name="user",
+                        to="auth.permission",
+                        verbose_name="user permissions",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "accounts",
+                "verbose_name_plural": "accounts",
+                "db_table": "accounts",
+                "db_table_comment": "user accounts",
+                "ordering": ["date_joined", "is_active"],
+                "get_latest_by": ["date_joined", "is_active"],
+                "abstract": False,
+                "managed": True,
+                "proxy": False,
+            },
+        ),
+        migrations.CreateModel(
+            name="AccountProfile",
+            fields=[
+                ("slug", models.SlugField(blank=True, verbose_name="profile link")),
+                (
+                    "user",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="account_profile",
+                        serialize=False,
+                        to=settings.AUTH_USER_MODEL,
+                        to_field="username",
+                    ),
+                ),
+                (
+                    "first_name",
+                    models.CharField(max_length=50, verbose_name="first name"),
+                ),
+                (
+                    "last_name",
+                    models.CharField(max_length=50, verbose_name="last name"),
+                ),
+                (
+                    "email",
+                    models.EmailField(
+                        max_length=254,
+                        unique=True,
+                        validators=[django.core.validators.EmailValidator],
+                        verbose_name="email address",
+                    ),
+                ),
+                (
+                    "phone",
+                    phonenumber_field.modelfields.PhoneNumberField(
+                        blank=True,
+                        help_text="please use international format. \n ex: +12223334444",
+                        max_length=128,
+                        region=None,
+                        verbose_name="phone number",
+                    ),
+                ),
+                (
+                    "is_public",
+                    models.BooleanField(
+                        default=False,
+                        help_text="check here to allow others to view your profile",
+                        verbose_name="profile is public",
+                    ),
+                ),
+                (
+                    "description",
+                    models.TextField(
+                        blank=True,
+                        max_length=1500,
+                        null=True,
+                        verbose_name="profile description",
+                    ),
+                ),
+                (
+                    "profile_pic",
+                    models.ImageField(
+                        blank=True,
+                        default="accounts/profile_image.png",
+                        null=True,
+                        upload_to=sbxt_accounts.utils.model_utils.user_profile_media,
+                        verbose_name="profile image",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "profiles",
+                "verbose_name_plural": "profiles",
+                "db_table": "accounts_profiles",
+                "db_table_comment": "user profiles",
+                "ordering": ["last_name", "first_name"],
+                "get_latest_by": ["user__date_joined"],
+                "abstract": False,
+                "managed": True,
+                "proxy": False,
+            },
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.18 on 2026-10-19 04:19
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0001_initial"),
+        ("auth", "0012_alter_user_first_name_max_length"),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name="customaccount",
+            constraint=models.UniqueConstraint(
+                django.db.models.functions.text.Lower("username"),
+                name="accounts_username_lower_uniq",
+                violation_error_message="that username is already taken",
+            ),
+        ),
+    ]
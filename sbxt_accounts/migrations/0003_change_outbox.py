@@ -0,0 +1,118 @@
+# Generated by Django 5.2.18 on 2026-10-19 04:21
+
+import django.core.serializers.json
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0002_username_lower_unique"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ChangeCursor",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "consumer",
+                    models.CharField(
+                        max_length=100, unique=True, verbose_name="consumer"
+                    ),
+                ),
+                (
+                    "position",
+                    models.BigIntegerField(default=0, verbose_name="position"),
+                ),
+                (
+                    "updated",
+                    models.DateTimeField(auto_now=True, verbose_name="updated"),
+                ),
+            ],
+            options={
+                "verbose_name": "change cursors",
+                "verbose_name_plural": "change cursors",
+                "db_table": "accounts_change_cursors",
+                "db_table_comment": "outbox consumer positions",
+                "ordering": ["consumer"],
+                "abstract": False,
+                "managed": True,
+                "proxy": False,
+            },
+        ),
+        migrations.CreateModel(
+            name="ChangeEvent",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("model", models.CharField(max_length=100, verbose_name="model")),
+                (
+                    "object_pk",
+                    models.CharField(max_length=64, verbose_name="object key"),
+                ),
+                (
+                    "action",
+                    models.CharField(
+                        choices=[
+                            ("create", "create"),
+                            ("update", "update"),
+                            ("delete", "delete"),
+                        ],
+                        max_length=6,
+                        verbose_name="action",
+                    ),
+                ),
+                (
+                    "payload",
+                    models.JSONField(
+                        blank=True,
+                        encoder=django.core.serializers.json.DjangoJSONEncoder,
+                        null=True,
+                        verbose_name="payload",
+                    ),
+                ),
+                (
+                    "created",
+                    models.DateTimeField(
+                        db_index=True,
+                        default=django.utils.timezone.now,
+                        verbose_name="created",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "change events",
+                "verbose_name_plural": "change events",
+                "db_table": "accounts_change_events",
+                "db_table_comment": "account and profile change outbox",
+                "ordering": ["id"],
+                "get_latest_by": ["id"],
+                "abstract": False,
+                "managed": True,
+                "proxy": False,
+                "indexes": [
+                    models.Index(
+                        fields=["model", "object_pk", "id"],
+                        name="accounts_change_obj_idx",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,80 @@
+# Generated by Django 5.2.18 on 2026-10-19 04:23
+
+import django.core.serializers.json
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0003_change_outbox"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ArchivedAccount",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "username",
+                    models.CharField(
+                        db_index=True, max_length=20, verbose_name="username"
+                    ),
+                ),
+                (
+                    "account",
+                    models.JSONField(
+                        encoder=django.core.serializers.json.DjangoJSONEncoder,
+                        verbose_name="account",
+                    ),
+                ),
+                (
+                    "profile",
+                    models.JSONField(
+                        blank=True,
+                        encoder=django.core.serializers.json.DjangoJSONEncoder,
+                        null=True,
+                        verbose_name="profile",
+                    ),
+                ),
+                (
+                    "groups",
+                    models.JSONField(blank=True, default=list, verbose_name="groups"),
+                ),
+                (
+                    "permissions",
+                    models.JSONField(
+                        blank=True, default=list, verbose_name="permissions"
+                    ),
+                ),
+                (
+                    "archived",
+                    models.DateTimeField(
+                        db_index=True,
+                        default=django.utils.timezone.now,
+                        verbose_name="archived",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "archived accounts",
+                "verbose_name_plural": "archived accounts",
+                "db_table": "accounts_archive",
+                "db_table_comment": "archived user accounts",
+                "ordering": ["-archived"],
+                "get_latest_by": ["archived"],
+                "abstract": False,
+                "managed": True,
+                "proxy": False,
+            },
+        ),
+    ]
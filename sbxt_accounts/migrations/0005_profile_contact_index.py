@@ -0,0 +1,82 @@
+# Generated by Django 5.2.18 on 2026-10-19 04:24
+
+import phonenumbers
+from django.conf import settings
+from django.db import migrations, models
+
+BATCH_SIZE: int = 1000
+
+
+# normalization is copied here so later changes to the app's helpers do not
+# change what this migration writes
+def phone_e164(phone, region):
+    if not phone:
+        return ""
+    try:
+        number = phonenumbers.parse(str(phone), region)
+    except phonenumbers.NumberParseException:
+        return ""
+    if not phonenumbers.is_valid_number(number):
+        return ""
+    return phonenumbers.format_number(number, phonenumbers.PhoneNumberFormat.E164)
+
+
+def canonical_email(email):
+    if not email:
+        return ""
+    local, at, domain = email.strip().lower().rpartition("@")
+    if not at:
+        return domain
+    return f"{local.split('+', 1)[0]}@{domain}"
+
+
+def fill_contact_columns(apps, schema_editor):
+    region = getattr(settings, "PHONENUMBER_DEFAULT_REGION", None)
+    AccountProfile = apps.get_model("accounts", "AccountProfile")
+    profiles = AccountProfile.objects.using(schema_editor.connection.alias)
+    last = None
+    while True:
+        batch = profiles.order_by("pk")
+        if last is not None:
+            batch = batch.filter(pk__gt=last)
+        batch = list(batch[:BATCH_SIZE])
+        if not batch:
+            return
+        for profile in batch:
+            profile.phone_e164 = phone_e164(profile.phone, region)
+            profile.email_canonical = canonical_email(profile.email)
+        profiles.bulk_update(batch, ["phone_e164", "email_canonical"])
+        last = batch[-1].pk
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0004_account_archive"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="accountprofile",
+            name="email_canonical",
+            field=models.CharField(
+                blank=True,
+                db_index=True,
+                editable=False,
+                max_length=254,
+                verbose_name="canonical email address",
+            ),
+        ),
+        migrations.AddField(
+            model_name="accountprofile",
+            name="phone_e164",
+            field=models.CharField(
+                blank=True,
+                db_index=True,
+                editable=False,
+                max_length=20,
+                verbose_name="normalized phone number",
+            ),
+        ),
+        migrations.RunPython(fill_contact_columns, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,110 @@
+# Generated by Django 5.2.18 on 2026-10-19 04:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0005_profile_contact_index"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="LoginEvent",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("username", models.CharField(max_length=20, verbose_name="username")),
+                (
+                    "action",
+                    models.CharField(
+                        choices=[("login", "login"), ("logout", "logout")],
+                        max_length=6,
+                        verbose_name="action",
+                    ),
+                ),
+                (
+                    "session_key",
+                    models.CharField(
+                        blank=True, max_length=40, verbose_name="session key"
+                    ),
+                ),
+                (
+                    "ip",
+                    models.GenericIPAddressField(
+                        blank=True, null=True, verbose_name="ip address"
+                    ),
+                ),
+                ("timestamp", models.DateTimeField(verbose_name="timestamp")),
+                ("day", models.DateField(verbose_name="day")),
+            ],
+            options={
+                "verbose_name": "login events",
+                "verbose_name_plural": "login events",
+                "db_table": "accounts_login_events",
+                "db_table_comment": "account login and logout history",
+                "ordering": ["-timestamp"],
+                "get_latest_by": ["timestamp"],
+                "abstract": False,
+                "managed": True,
+                "proxy": False,
+                "indexes": [
+                    models.Index(fields=["day"], name="accounts_login_day_idx"),
+                    models.Index(
+                        fields=["username", "day"], name="accounts_login_user_day_idx"
+                    ),
+                ],
+            },
+        ),
+        migrations.CreateModel(
+            name="LoginRollup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("username", models.CharField(max_length=20, verbose_name="username")),
+                ("day", models.DateField(verbose_name="day")),
+                (
+                    "logins",
+                    models.PositiveIntegerField(default=0, verbose_name="logins"),
+                ),
+                (
+                    "logouts",
+                    models.PositiveIntegerField(default=0, verbose_name="logouts"),
+                ),
+            ],
+            options={
+                "verbose_name": "login rollups",
+                "verbose_name_plural": "login rollups",
+                "db_table": "accounts_login_rollups",
+                "db_table_comment": "daily account login counts",
+                "ordering": ["-day"],
+                "get_latest_by": ["day"],
+                "abstract": False,
+                "managed": True,
+                "proxy": False,
+                "indexes": [
+                    models.Index(fields=["day"], name="accounts_rollup_day_idx")
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("username", "day"), name="accounts_login_rollup_uniq"
+                    )
+                ],
+            },
+        ),
+    ]
@@ -1,11 +1,21 @@
 # accounts/models/__init__.py
 from .account_models import CustomAccountManager, CustomAccount
-from .profile_models import AccountProfile
+from .profile_models import AccountProfileManager, AccountProfile
+from .outbox_models import ChangeEventManager, ChangeEvent, ChangeCursor
+from .archive_models import ArchivedAccount
+from .history_models import LoginEvent, LoginRollup
 
 modules: list[str] = [
     CustomAccountManager.__doc__,
     CustomAccount.__doc__,
+    AccountProfileManager.__doc__,
     AccountProfile.__doc__,
+    ChangeEventManager.__doc__,
+    ChangeEvent.__doc__,
+    ChangeCursor.__doc__,
+    ArchivedAccount.__doc__,
+    LoginEvent.__doc__,
+    LoginRollup.__doc__,
 ]
 """modules is a list of docstrings for each model"""
 
@@ -10,20 +10,165 @@ from django.db.models import (
     BooleanField,
     DateTimeField,
     SlugField,
+    UniqueConstraint,
+    QuerySet,
+    Case,
+    When,
+    Value,
+    Count,
+    OuterRef,
+    Subquery,
+    IntegerField,
 )
+from django.db import transaction
+from django.db.models.functions import Coalesce, Lower
 from django.urls import reverse
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from sbxt_accounts.utils import get_bool, normalize_username
 from sbxt_accounts.validators import UsernameValidator
+from .outbox_models import ChangeEvent
 
 
-class CustomAccountManager(BaseUserManager):
+class CustomAccountQuerySet(QuerySet):
+    """CustomAccountQuerySet
+
+    QuerySet for :class:`CustomAccount` with summary annotations for list
+    views such as the admin changelist.
+    """
+
+    def _count(self, queryset: QuerySet, key: str) -> Coalesce:
+        """count `queryset` rows per account as a correlated subquery"""
+        counts: QuerySet = (
+            queryset.filter(**{key: OuterRef("pk")})
+            .order_by()
+            .values(key)
+            .annotate(n=Count("pk", distinct=True))
+            .values("n")
+        )
+        return Coalesce(Subquery(counts, output_field=IntegerField()), 0)
+
+    def with_summaries(self) -> "CustomAccountQuerySet":
+        """CustomAccountQuerySet.with_summaries
+
+        Annotates each account, in the same query, with:
+
+            - status_label: :meth:`CustomAccount.status`
+            - group_count: number of groups
+            - permission_count: number of direct permissions
+            - group_permission_count: number of distinct permissions
+              granted through groups
+
+        The counts are correlated subqueries, so they do not multiply rows
+        the way joined aggregates would.
+
+        Returns:
+            CustomAccountQuerySet: the annotated queryset
+        """
+        from django.contrib.auth.models import Permission
+
+        groups = self.model._meta.get_field("groups")
+        permissions = self.model._meta.get_field("user_permissions")
+        return self.annotate(
+            status_label=Case(
+                When(is_active=True, then=Value(get_bool(True))),
+                default=Value(get_bool(False)),
+                output_field=CharField(),
+            ),
+            group_count=self._count(
+                groups.remote_field.through.objects.all(), groups.m2m_field_name()
+            ),
+            permission_count=self._count(
+                permissions.remote_field.through.objects.all(),
+                permissions.m2m_field_name(),
+            ),
+            group_permission_count=self._count(
+                Permission.objects.all(), f"group__{groups.related_query_name()}"
+            ),
+        )
+
+
+class CustomAccountManager(BaseUserManager.from_queryset(CustomAccountQuerySet)):
     """CustomUserManager
 
     Custom user model manager for authentication
+
+    Usernames are normalized with
+    :func:`sbxt_accounts.utils.normalize_username` on every write path,
+    including :meth:`bulk_create` and :meth:`bulk_update`, and looked up through the
+    ``LOWER(username)`` unique index in :meth:`get_by_natural_key`.
     """
 
+    def get_by_natural_key(self, username: str) -> "CustomAccount":
+        """CustomUserManager.get_by_natural_key
+
+        Case-insensitive lookup that matches the ``LOWER(username)`` unique
+        index instead of scanning with ``iexact``.
+
+        Args:
+            username (str): username in any case
+
+        Raises:
+            CustomAccount.DoesNotExist: no account has the username
+
+        Returns:
+            CustomAccount: the matching account
+        """
+        return self.alias(username_lower=Lower("username")).get(
+            username_lower=normalize_username(username)
+        )
+
+    def bulk_create(self, objs, *args, **kwargs) -> list["CustomAccount"]:
+        """CustomUserManager.bulk_create
+
+        Normalizes each username like :meth:`CustomAccount.save` before
+        handing the batch to the default ``bulk_create`` and records the
+        new accounts in the change outbox in the same transaction.
+
+        Raises:
+            ValueError: `ignore_conflicts` or `update_conflicts` is set
+        """
+        if kwargs.get("ignore_conflicts") or kwargs.get("update_conflicts"):
+            # rows skipped or updated on conflict can't be told apart from
+            # new ones, so their outbox events would be wrong
+            raise ValueError(
+                "bulk_create() does not support ignore_conflicts or "
+                "update_conflicts on accounts"
+            )
+        objs: list = list(objs)
+        for obj in objs:
+            obj.username = normalize_username(obj.username)
+        with transaction.atomic(using=self.db, savepoint=False):
+            created: list = super().bulk_create(objs, *args, **kwargs)
+            missing: dict[str, "CustomAccount"] = {
+                obj.username: obj for obj in created if obj.pk is None
+            }
+            if missing:
+                # backends that do not return primary keys from bulk inserts
+                for username, pk in self.filter(username__in=list(missing)).values_list(
+                    "username", "pk"
+                ):
+                    missing[username].pk = pk
+            ChangeEvent.objects.record_many(created, ChangeEvent.CREATE, using=self.db)
+        return created
+
+    def bulk_update(self, objs, fields, *args, **kwargs) -> int:
+        """CustomUserManager.bulk_update
+
+        Normalizes each username like :meth:`CustomAccount.save` when
+        ``username`` is among the updated `fields`, and records the updates
+        in the change outbox in the same transaction.
+        """
+        objs: list = list(objs)
+        fields: list[str] = list(fields)
+        if "username" in fields:
+            for obj in objs:
+                obj.username = normalize_username(obj.username)
+        with transaction.atomic(using=self.db, savepoint=False):
+            updated: int = super().bulk_update(objs, fields, *args, **kwargs)
+            ChangeEvent.objects.record_many(objs, ChangeEvent.UPDATE, using=self.db)
+        return updated
+
     def create_user(
         self,
         username: str,
@@ -52,7 +197,7 @@ class CustomAccountManager(BaseUserManager):
             if not k:
                 raise ValueError(v)
 
-        username: str = username.lower()
+        username: str = normalize_username(username)
         user: self.model = self.model(
             username=username, password=password, **extra_fields
         )  #: user
@@ -106,9 +251,7 @@ class CustomAccountManager(BaseUserManager):
                 # raise ValueEror if field is not set
                 raise ValueError(e)
 
-        return self.create_user(
-            username=username, password=password, extra_fields=extra_fields
-        )
+        return self.create_user(username=username, password=password, **extra_fields)
 
 
 class CustomAccount(AbstractBaseUser, PermissionsMixin):
@@ -147,6 +290,13 @@ class CustomAccount(AbstractBaseUser, PermissionsMixin):
             "is_active",
         ]
         ordering: list[str] = get_latest_by
+        constraints: list[UniqueConstraint] = [
+            UniqueConstraint(
+                Lower("username"),
+                name="accounts_username_lower_uniq",
+                violation_error_message=_("that username is already taken"),
+            ),
+        ]
 
     username_validator: UsernameValidator = UsernameValidator()
     USERNAME_FIELD: str = "username"  #: field for username
@@ -218,7 +368,9 @@ class CustomAccount(AbstractBaseUser, PermissionsMixin):
         """save
 
         Overwrites the default save function to normalize the username
-        and populate the slug field.
+        and populate the slug field. Saves atomically so the change outbox
+        event is written in the same transaction.
         """
         self.username = normalize_username(self.username)
-        return super(CustomAccount, self).save(*args, **kwargs)
+        with transaction.atomic(using=kwargs.get("using"), savepoint=False):
+            return super(CustomAccount, self).save(*args, **kwargs)
@@ -0,0 +1,83 @@
+# accounts/models/archive_models.py
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import (
+    Model,
+    CharField,
+    DateTimeField,
+    JSONField,
+)
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+
+class ArchivedAccount(Model):
+    """ArchivedAccount
+
+    A compact copy of a purged :class:`CustomAccount`, its
+    :class:`AccountProfile` and its group and permission links, written by
+    :class:`sbxt_accounts.purge.PurgeEngine` before the rows are deleted.
+    """
+
+    class Meta:
+        """Meta for ArchivedAccount"""
+
+        db_table: str = "accounts_archive"
+        db_table_comment: str = "archived user accounts"
+        managed: bool = True
+        verbose_name: str = _("archived accounts")
+        # additional options
+        verbose_name_plural: str = verbose_name
+        proxy: bool = False
+        abstract: bool = False
+        get_latest_by: list[str] = ["archived"]
+        ordering: list[str] = ["-archived"]
+
+    username: CharField = CharField(
+        _("username"),
+        max_length=20,
+        db_index=True,
+    )  #: username of the purged account
+    account: JSONField = JSONField(
+        _("account"),
+        encoder=DjangoJSONEncoder,
+    )  #: account field values, without the password
+    profile: JSONField = JSONField(
+        _("profile"),
+        encoder=DjangoJSONEncoder,
+        blank=True,
+        null=True,
+    )  #: profile field values, if the account had a profile
+    groups: JSONField = JSONField(
+        _("groups"),
+        default=list,
+        blank=True,
+    )  #: names of the account's groups
+    permissions: JSONField = JSONField(
+        _("permissions"),
+        default=list,
+        blank=True,
+    )  #: "app_label.codename" of the account's direct permissions
+    archived: DateTimeField = DateTimeField(
+        _("archived"),
+        default=timezone.now,
+        db_index=True,
+    )  #: time the account was purged
+
+    def __str__(self) -> str:
+        return self.username
+
+    def as_dict(self) -> dict:
+        """as_dict
+
+        Returns:
+            dict: the archive record as written to an archive file
+        """
+        return {
+            "username": self.username,
+            "account": self.account,
+            "profile": self.profile,
+            "groups": self.groups,
+            "permissions": self.permissions,
+            "archived": self.archived.isoformat(),
+        }
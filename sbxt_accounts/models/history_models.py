@@ -0,0 +1,129 @@
+# accounts/models/history_models.py
+
+from django.db.models import (
+    Model,
+    CharField,
+    DateField,
+    DateTimeField,
+    GenericIPAddressField,
+    PositiveIntegerField,
+    Index,
+    UniqueConstraint,
+)
+from django.utils.translation import gettext_lazy as _
+
+
+class LoginEvent(Model):
+    """LoginEvent
+
+    One login or logout of a :class:`CustomAccount`.
+
+    Events are append-only and written in batches by
+    :class:`sbxt_accounts.login_history.LoginHistoryBuffer`. ``day`` is the
+    partition key: queries and pruning work on whole days, and on
+    databases with declarative partitioning the table can be partitioned
+    on it.
+    """
+
+    LOGIN: str = "login"
+    LOGOUT: str = "logout"
+    ACTIONS: list[tuple[str, str]] = [
+        (LOGIN, _("login")),
+        (LOGOUT, _("logout")),
+    ]  #: choices for action
+
+    class Meta:
+        """Meta for LoginEvent"""
+
+        db_table: str = "accounts_login_events"
+        db_table_comment: str = "account login and logout history"
+        managed: bool = True
+        verbose_name: str = _("login events")
+        # additional options
+        verbose_name_plural: str = verbose_name
+        proxy: bool = False
+        abstract: bool = False
+        get_latest_by: list[str] = ["timestamp"]
+        ordering: list[str] = ["-timestamp"]
+        indexes: list[Index] = [
+            Index(fields=["day"], name="accounts_login_day_idx"),
+            Index(fields=["username", "day"], name="accounts_login_user_day_idx"),
+        ]
+
+    username: CharField = CharField(
+        _("username"),
+        max_length=20,
+    )  #: account username, kept as text so history outlives the account
+    action: CharField = CharField(
+        _("action"),
+        max_length=6,
+        choices=ACTIONS,
+    )  #: login or logout
+    session_key: CharField = CharField(
+        _("session key"),
+        max_length=40,
+        blank=True,
+    )  #: session the event belongs to
+    ip: GenericIPAddressField = GenericIPAddressField(
+        _("ip address"),
+        blank=True,
+        null=True,
+    )  #: client address
+    timestamp: DateTimeField = DateTimeField(
+        _("timestamp"),
+    )  #: time of the event
+    day: DateField = DateField(
+        _("day"),
+    )  #: UTC day of `timestamp`, the partition key
+
+    def __str__(self) -> str:
+        return f"{self.username} {self.action} {self.timestamp}"
+
+
+class LoginRollup(Model):
+    """LoginRollup
+
+    Daily login and logout counts for one account, kept up to date as
+    :class:`LoginEvent` batches are flushed.
+    """
+
+    class Meta:
+        """Meta for LoginRollup"""
+
+        db_table: str = "accounts_login_rollups"
+        db_table_comment: str = "daily account login counts"
+        managed: bool = True
+        verbose_name: str = _("login rollups")
+        # additional options
+        verbose_name_plural: str = verbose_name
+        proxy: bool = False
+        abstract: bool = False
+        get_latest_by: list[str] = ["day"]
+        ordering: list[str] = ["-day"]
+        constraints: list[UniqueConstraint] = [
+            UniqueConstraint(
+                fields=["username", "day"], name="accounts_login_rollup_uniq"
+            ),
+        ]
+        indexes: list[Index] = [
+            Index(fields=["day"], name="accounts_rollup_day_idx"),
+        ]
+
+    username: CharField = CharField(
+        _("username"),
+        max_length=20,
+    )  #: account username
+    day: DateField = DateField(
+        _("day"),
+    )  #: UTC day
+    logins: PositiveIntegerField = PositiveIntegerField(
+        _("logins"),
+        default=0,
+    )  #: logins on `day`
+    logouts: PositiveIntegerField = PositiveIntegerField(
+        _("logouts"),
+        default=0,
+    )  #: logouts on `day`
+
+    def __str__(self) -> str:
+        return f"{self.username} {self.day}: {self.logins}/{self.logouts}"
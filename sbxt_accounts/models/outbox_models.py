@@ -0,0 +1,221 @@
+# accounts/models/outbox_models.py
+
+from typing import Iterable, Optional
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import (
+    Model,
+    Manager,
+    CharField,
+    BigIntegerField,
+    DateTimeField,
+    JSONField,
+    Index,
+)
+from django.utils import timezone
+from django.utils.translation import gettext_lazy as _
+
+EXCLUDED_FIELDS: frozenset[str] = frozenset(["password"])
+"""fields that are never copied into a change event"""
+
+
+class ChangeEventManager(Manager):
+    """ChangeEventManager
+
+    Writes :class:`ChangeEvent` rows for saved and deleted model instances.
+    Call it inside the transaction that changes the instance so the event
+    is committed (or rolled back) with it.
+    """
+
+    @staticmethod
+    def serialize(instance: Model) -> dict[str, Optional[str]]:
+        """ChangeEventManager.serialize
+
+        Args:
+            instance (Model): a model instance
+
+        Returns:
+            dict[str, str | None]: the instance's concrete field values as
+            strings, without :data:`EXCLUDED_FIELDS`
+        """
+        return {
+            f.attname: (
+                None
+                if f.value_from_object(instance) is None
+                else f.value_to_string(instance)
+            )
+            for f in instance._meta.concrete_fields
+            if f.name not in EXCLUDED_FIELDS
+        }
+
+    def build(self, instance: Model, action: str) -> "ChangeEvent":
+        """ChangeEventManager.build
+
+        Args:
+            instance (Model): the changed instance
+            action (str): :attr:`ChangeEvent.CREATE`, `UPDATE` or `DELETE`
+
+        Returns:
+            ChangeEvent: an unsaved event
+        """
+        return self.model(
+            model=instance._meta.label_lower,
+            object_pk=str(instance.pk),
+            action=action,
+            payload=None if action == ChangeEvent.DELETE else self.serialize(instance),
+        )
+
+    def record(self, instance: Model, action: str) -> "ChangeEvent":
+        """ChangeEventManager.record
+
+        Returns:
+            ChangeEvent: the saved event, see :meth:`build`
+        """
+        event: ChangeEvent = self.build(instance, action)
+        event.save(using=instance._state.db or "default")
+        return event
+
+    def record_many(
+        self,
+        instances: Iterable[Model],
+        action: str,
+        using: Optional[str] = None,
+    ) -> list["ChangeEvent"]:
+        """ChangeEventManager.record_many
+
+        Writes one event per instance with a single ``bulk_create`` for
+        paths, such as ``bulk_create``, that do not send model signals.
+
+        Args:
+            instances (Iterable[Model]): the changed instances
+            action (str): :attr:`ChangeEvent.CREATE`, `UPDATE` or `DELETE`
+            using (str | None): database alias
+
+        Returns:
+            list[ChangeEvent]: the saved events
+        """
+        return self.db_manager(using).bulk_create(
+            [self.build(i, action) for i in instances]
+        )
+
+
+class ChangeEvent(Model):
+    """ChangeEvent
+
+    A transactional outbox record of one change to a
+    :class:`CustomAccount` or :class:`AccountProfile`.
+
+    Events are read in ``id`` order by
+    :class:`sbxt_accounts.outbox.OutboxConsumer`. Each event carries the
+    full row (less :data:`EXCLUDED_FIELDS`), so consumers upsert on
+    ``(model, object_pk)`` and older events for an object can be
+    compacted away.
+    """
+
+    CREATE: str = "create"
+    UPDATE: str = "update"
+    DELETE: str = "delete"
+    ACTIONS: list[tuple[str, str]] = [
+        (CREATE, _("create")),
+        (UPDATE, _("update")),
+        (DELETE, _("delete")),
+    ]  #: choices for action
+
+    class Meta:
+        """Meta for ChangeEvent"""
+
+        db_table: str = "accounts_change_events"
+        db_table_comment: str = "account and profile change outbox"
+        managed: bool = True
+        verbose_name: str = _("change events")
+        # additional options
+        verbose_name_plural: str = verbose_name
+        proxy: bool = False
+        abstract: bool = False
+        get_latest_by: list[str] = ["id"]
+        ordering: list[str] = ["id"]
+        indexes: list[Index] = [
+            Index(fields=["model", "object_pk", "id"], name="accounts_change_obj_idx"),
+        ]
+
+    model: CharField = CharField(
+        _("model"),
+        max_length=100,
+    )  #: app_label.model_name of the changed instance
+    object_pk: CharField = CharField(
+        _("object key"),
+        max_length=64,
+    )  #: primary key of the changed instance
+    action: CharField = CharField(
+        _("action"),
+        max_length=6,
+        choices=ACTIONS,
+    )  #: create, update or delete
+    payload: JSONField = JSONField(
+        _("payload"),
+        encoder=DjangoJSONEncoder,
+        blank=True,
+        null=True,
+    )  #: field values after the change, `None` for deletes
+    created: DateTimeField = DateTimeField(
+        _("created"),
+        default=timezone.now,
+        db_index=True,
+    )  #: time the event was written
+
+    objects: ChangeEventManager = ChangeEventManager()
+
+    def __str__(self) -> str:
+        return f"{self.id}: {self.action} {self.model} {self.object_pk}"
+
+    def as_dict(self) -> dict:
+        """as_dict
+
+        Returns:
+            dict: the event in the shape consumers receive
+        """
+        return {
+            "id": self.id,
+            "model": self.model,
+            "pk": self.object_pk,
+            "action": self.action,
+            "payload": self.payload,
+            "created": self.created.isoformat(),
+        }
+
+
+class ChangeCursor(Model):
+    """ChangeCursor
+
+    The high-water mark of one outbox consumer: the id of the last
+    :class:`ChangeEvent` it acknowledged.
+    """
+
+    class Meta:
+        """Meta for ChangeCursor"""
+
+        db_table: str = "accounts_change_cursors"
+        db_table_comment: str = "outbox consumer positions"
+        managed: bool = True
+        verbose_name: str = _("change cursors")
+        # additional options
+        verbose_name_plural: str = verbose_name
+        proxy: bool = False
+        abstract: bool = False
+        ordering: list[str] = ["consumer"]
+
+    consumer: CharField = CharField(
+        _("consumer"),
+        max_length=100,
+        unique=True,
+    )  #: consumer name
+    position: BigIntegerField = BigIntegerField(
+        _("position"),
+        default=0,
+    )  #: id of the last acknowledged event
+    updated: DateTimeField = DateTimeField(
+        _("updated"),
+        auto_now=True,
+    )  #: time of the last acknowledgement
+
+    def __str__(self) -> str:
+        return f"{self.consumer}: {self.position}"
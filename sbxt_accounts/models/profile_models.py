@@ -1,8 +1,13 @@
 # accounts/models/profile_models.py
 
+from itertools import groupby
+from typing import Iterator
 from django.core.validators import EmailValidator
+from django.db import transaction
 from django.db.models import (
     Model,
+    Manager,
+    Count,
     CharField,
     TextField,
     SlugField,
@@ -19,7 +24,104 @@ from phonenumber_field.modelfields import PhoneNumberField
 from sbxt_accounts.utils import (
     user_profile_media,
     format_name,
+    normalize_contacts,
 )
+from .outbox_models import ChangeEvent
+
+
+class AccountProfileManager(Manager):
+    """AccountProfileManager
+
+    Manager for :class:`AccountProfile` that fills the normalized contact
+    columns and records bulk writes in the change outbox.
+    """
+
+    CONTACT_FIELDS: dict[str, str] = {
+        "phone": "phone_e164",
+        "email": "email_canonical",
+    }  #: contact field -> normalized column
+
+    def bulk_create(self, objs, *args, **kwargs) -> list["AccountProfile"]:
+        """AccountProfileManager.bulk_create
+
+        Normalizes the batch's contact columns, then creates the profiles
+        and their change outbox events in one transaction.
+
+        Raises:
+            ValueError: `ignore_conflicts` or `update_conflicts` is set
+        """
+        if kwargs.get("ignore_conflicts") or kwargs.get("update_conflicts"):
+            # rows skipped or updated on conflict can't be told apart from
+            # new ones, so their outbox events would be wrong
+            raise ValueError(
+                "bulk_create() does not support ignore_conflicts or "
+                "update_conflicts on profiles"
+            )
+        objs: list = normalize_contacts(objs)
+        with transaction.atomic(using=self.db, savepoint=False):
+            created: list = super().bulk_create(objs, *args, **kwargs)
+            ChangeEvent.objects.record_many(created, ChangeEvent.CREATE, using=self.db)
+        return created
+
+    def bulk_update(self, objs, fields, *args, **kwargs) -> int:
+        """AccountProfileManager.bulk_update
+
+        Keeps the normalized contact columns in step when ``phone`` or
+        ``email`` are among the updated `fields`, and records the updates
+        in the change outbox in the same transaction.
+        """
+        objs: list = list(objs)
+        fields: list[str] = list(fields)
+        extra: list[str] = [
+            column
+            for field, column in self.CONTACT_FIELDS.items()
+            if field in fields and column not in fields
+        ]
+        if extra:
+            objs: list = normalize_contacts(objs)
+            fields += extra
+        with transaction.atomic(using=self.db, savepoint=False):
+            updated: int = super().bulk_update(objs, fields, *args, **kwargs)
+            ChangeEvent.objects.record_many(objs, ChangeEvent.UPDATE, using=self.db)
+        return updated
+
+    def duplicate_clusters(
+        self,
+        field: str,
+        chunk_size: int = 2000,
+    ) -> Iterator[tuple[str, list[str]]]:
+        """AccountProfileManager.duplicate_clusters
+
+        Streams groups of profiles that share a normalized phone number or
+        email address. Duplicate values are found with one grouped query
+        over the column's index and their profiles are read in value
+        order, so no profiles are compared pairwise.
+
+        Args:
+            field (str): ``"phone"`` or ``"email"``
+            chunk_size (int): rows fetched per round trip
+
+        Yields:
+            tuple[str, list[str]]: the shared value and the usernames of
+            the profiles that have it
+        """
+        column: str = self.CONTACT_FIELDS[field]
+        duplicates = (
+            self.exclude(**{column: ""})
+            .values(column)
+            .annotate(profiles=Count("pk"))
+            .filter(profiles__gt=1)
+            .values(column)
+            .order_by()
+        )
+        rows: Iterator[tuple[str, str]] = (
+            self.filter(**{f"{column}__in": duplicates})
+            .order_by(column, "pk")
+            .values_list(column, "pk")
+            .iterator(chunk_size=chunk_size)
+        )
+        for value, members in groupby(rows, key=lambda r: r[0]):
+            yield value, [pk for _, pk in members]
 
 
 class AccountProfile(Model):
@@ -51,14 +153,14 @@ class AccountProfile(Model):
             "first_name",
         ]
 
-    slug: SlugField = SlugField(_("profile link"), blank=True)
-    account: OneToOneField = OneToOneField(
-        "sbxt_accounts.CustomAccount",
+    slug: SlugField = SlugField(_("profile link"), blank=True)  #: slug field for url
+    user: OneToOneField = OneToOneField(
+        "accounts.CustomAccount",
         to_field="username",
         related_name="account_profile",
         on_delete=CASCADE,
         primary_key=True,
-    )  #: slug field for url
+    )  #: the profile's account
     first_name: CharField = CharField(
         _("first name"),
         max_length=50,
@@ -81,6 +183,20 @@ class AccountProfile(Model):
         blank=True,
         help_text="please use international format. \n ex: +12223334444",
     )  # phone number
+    phone_e164: CharField = CharField(
+        _("normalized phone number"),
+        max_length=20,
+        blank=True,
+        editable=False,
+        db_index=True,
+    )  #: `phone` in E.164 format, filled on save
+    email_canonical: CharField = CharField(
+        _("canonical email address"),
+        max_length=254,
+        blank=True,
+        editable=False,
+        db_index=True,
+    )  #: lowercased `email` without a +tag, filled on save
     is_public: BooleanField = BooleanField(
         _("profile is public"),
         default=False,
@@ -100,6 +216,8 @@ class AccountProfile(Model):
         null=True,
     )  #: profile picture
 
+    objects: AccountProfileManager = AccountProfileManager()
+
     def __str__(self) -> str:
         """__str__
 
@@ -143,5 +261,20 @@ class AccountProfile(Model):
         return reverse("profile-detail", kwargs={"slug": self.slug})
 
     def save(self, *args, **kwargs) -> "AccountProfile":
+        """save
+
+        Populates the slug field and the normalized contact columns and
+        saves atomically so the change outbox event is written in the same
+        transaction.
+        """
         self.slug = self.user.get_slug()
-        return super(AccountProfile, self).save(*args, **kwargs)
+        normalize_contacts([self])
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None:
+            kwargs["update_fields"] = set(update_fields) | {
+                column
+                for field, column in AccountProfileManager.CONTACT_FIELDS.items()
+                if field in update_fields
+            }
+        with transaction.atomic(using=kwargs.get("using"), savepoint=False):
+            return super(AccountProfile, self).save(*args, **kwargs)
@@ -0,0 +1,349 @@
+"""accounts/outbox.py
+
+Consumers for the account and profile change outbox.
+
+Every save or delete of a :class:`sbxt_accounts.models.CustomAccount` or
+:class:`sbxt_accounts.models.AccountProfile` writes a
+:class:`sbxt_accounts.models.ChangeEvent` in the same transaction.
+Downstream services read those events in ``id`` order from their own
+high-water mark instead of scanning the tables, so the cost of a sync
+depends on the number of changes, not on the size of the tables.
+
+Ids are handed out when an event is inserted, not when its transaction
+commits, so a lower id can become visible after a higher one. Consumers
+therefore stop at a gap in the ids and only read past it once the event
+after the gap is `gap_timeout` old. Gaps left by rolled back transactions
+or by :func:`compact` cost at most that delay.
+"""
+
+import json
+import sqlite3
+from datetime import timedelta
+from typing import Callable, Iterator, Optional
+from django.db import transaction
+from django.db.models import Count, Max, Min
+from django.utils import timezone
+from sbxt_accounts.models import ChangeCursor, ChangeEvent
+
+DEFAULT_BATCH_SIZE: int = 500  #: events read per batch
+DEFAULT_GAP_TIMEOUT: timedelta = timedelta(
+    seconds=60
+)  #: how long a consumer waits for a missing id to commit
+
+
+class OutboxConsumer:
+    """OutboxConsumer
+
+    Reads :class:`ChangeEvent` batches after a named
+    :class:`ChangeCursor` and moves the cursor forward as batches are
+    acknowledged.
+
+    Example::
+
+        >>> consumer = OutboxConsumer("search-index")
+        >>> consumer.consume(lambda events: index(e.as_dict() for e in events))
+        1200
+
+    Args:
+        name (str): consumer name, one cursor is kept per name
+        batch_size (int): events read per batch
+        gap_timeout (timedelta): how long to hold back at a missing id
+            before treating it as rolled back or compacted; transactions
+            that stay open longer than this can still be skipped
+    """
+
+    def __init__(
+        self,
+        name: str,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        gap_timeout: timedelta = DEFAULT_GAP_TIMEOUT,
+    ) -> None:
+        self.name: str = name
+        self.batch_size: int = batch_size
+        self.gap_timeout: timedelta = gap_timeout
+
+    @property
+    def position(self) -> int:
+        """id of the last acknowledged event"""
+        return (
+            ChangeCursor.objects.filter(consumer=self.name)
+            .values_list("position", flat=True)
+            .first()
+            or 0
+        )
+
+    def read(self, after: Optional[int] = None) -> list[ChangeEvent]:
+        """read
+
+        Args:
+            after (int | None): read events after this id, defaults to
+                :attr:`position`
+
+        Returns:
+            list[ChangeEvent]: up to `batch_size` events in id order, cut
+            short at the first recent gap in the ids
+        """
+        after: int = self.position if after is None else after
+        events: list[ChangeEvent] = list(
+            ChangeEvent.objects.filter(id__gt=after).order_by("id")[: self.batch_size]
+        )
+        settled = timezone.now() - self.gap_timeout
+        # a new consumer has nothing to wait for below its first event
+        expected: Optional[int] = after + 1 if after else None
+        for i, event in enumerate(events):
+            if (
+                expected is not None
+                and event.id != expected
+                and event.created > settled
+            ):
+                return events[:i]
+            expected = event.id + 1
+        return events
+
+    def ack(self, events: list[ChangeEvent]) -> int:
+        """ack
+
+        Moves the cursor to the last of `events`.
+
+        Args:
+            events (list[ChangeEvent]): a batch returned by :meth:`read`
+
+        Returns:
+            int: the new position
+        """
+        if not events:
+            return self.position
+        position: int = events[-1].id
+        ChangeCursor.objects.update_or_create(
+            consumer=self.name, defaults={"position": position}
+        )
+        return position
+
+    def batches(self) -> Iterator[list[ChangeEvent]]:
+        """batches
+
+        Yields batches until the outbox is drained, acknowledging each batch
+        when the next one is requested.
+
+        Yields:
+            list[ChangeEvent]: the next batch
+        """
+        after: int = self.position
+        while True:
+            events: list[ChangeEvent] = self.read(after)
+            if not events:
+                return
+            yield events
+            after = self.ack(events)
+
+    def consume(self, handler: Callable[[list[ChangeEvent]], None]) -> int:
+        """consume
+
+        Passes every pending batch to `handler`. A batch is acknowledged
+        only after `handler` returns, so a failing handler sees the same
+        batch again on the next run.
+
+        Args:
+            handler (Callable): called with each batch
+
+        Returns:
+            int: number of events handled
+        """
+        count: int = 0
+        for events in self.batches():
+            handler(events)
+            count += len(events)
+        return count
+
+
+def compact(batch_size: int = DEFAULT_BATCH_SIZE) -> int:
+    """compact
+
+    Deletes events that have a newer event for the same object. Events
+    carry the full row, so only the newest one per object is needed.
+
+    Args:
+        batch_size (int): objects compacted per query
+
+    Returns:
+        int: number of deleted events
+    """
+    deleted: int = 0
+    superseded = (
+        ChangeEvent.objects.values("model", "object_pk")
+        .annotate(latest=Max("id"), events=Count("id"))
+        .filter(events__gt=1)
+        .order_by()
+    )
+    rows: list[dict] = list(superseded[:batch_size])
+    while rows:
+        with transaction.atomic():
+            for row in rows:
+                deleted += ChangeEvent.objects.filter(
+                    model=row["model"],
+                    object_pk=row["object_pk"],
+                    id__lt=row["latest"],
+                ).delete()[0]
+        rows = list(superseded[:batch_size])
+    return deleted
+
+
+def prune(retention: timedelta = timedelta(days=7)) -> int:
+    """prune
+
+    Deletes events older than `retention` that every consumer has
+    acknowledged. Nothing is deleted while no consumer has a
+    :class:`ChangeCursor`, since there is no way to tell what is still
+    unread.
+
+    Args:
+        retention (timedelta): how long events are kept
+
+    Returns:
+        int: number of deleted events
+    """
+    slowest: Optional[int] = ChangeCursor.objects.aggregate(p=Min("position"))["p"]
+    if slowest is None:
+        return 0
+    return ChangeEvent.objects.filter(
+        created__lt=timezone.now() - retention, id__lte=slowest
+    ).delete()[0]
+
+
+class SQLiteMirror:
+    """SQLiteMirror
+
+    A local consumer that mirrors outbox events into a SQLite file with the
+    standard library ``sqlite3`` module. The mirror keeps its own
+    high-water mark in the same file, so it can be rebuilt or moved, and
+    copies it to a :class:`ChangeCursor` named `name` so :func:`prune`
+    does not delete events it has not applied yet.
+
+    Example::
+
+        >>> mirror = SQLiteMirror("accounts_mirror.sqlite3")
+        >>> mirror.sync()
+        42
+        >>> mirror.get("accounts.customaccount", "12")["username"]
+        'normie'
+
+    Args:
+        path (str): SQLite database path, ``":memory:"`` works for tests
+        batch_size (int): events read per batch
+        gap_timeout (timedelta): see :class:`OutboxConsumer`
+        name (str): consumer name of the mirror's :class:`ChangeCursor`
+    """
+
+    def __init__(
+        self,
+        path: str,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        gap_timeout: timedelta = DEFAULT_GAP_TIMEOUT,
+        name: str = "sqlite-mirror",
+    ) -> None:
+        self.name: str = name
+        self.batch_size: int = batch_size
+        self.gap_timeout: timedelta = gap_timeout
+        self.connection: sqlite3.Connection = sqlite3.connect(path)
+        self.connection.executescript("""
+            CREATE TABLE IF NOT EXISTS mirror (
+                model TEXT NOT NULL,
+                object_pk TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                PRIMARY KEY (model, object_pk)
+            );
+            CREATE TABLE IF NOT EXISTS position (
+                id INTEGER PRIMARY KEY CHECK (id = 0),
+                event_id INTEGER NOT NULL
+            );
+            INSERT OR IGNORE INTO position (id, event_id) VALUES (0, 0);
+            """)
+
+    @property
+    def position(self) -> int:
+        """id of the last applied event"""
+        return self.connection.execute(
+            "SELECT event_id FROM position WHERE id = 0"
+        ).fetchone()[0]
+
+    def apply(self, events: list[ChangeEvent]) -> None:
+        """apply
+
+        Applies a batch and moves the mirror's position in one SQLite
+        transaction.
+
+        Args:
+            events (list[ChangeEvent]): events in id order
+        """
+        with self.connection:
+            for e in events:
+                if e.action == ChangeEvent.DELETE:
+                    self.connection.execute(
+                        "DELETE FROM mirror WHERE model = ? AND object_pk = ?",
+                        (e.model, e.object_pk),
+                    )
+                else:
+                    self.connection.execute(
+                        "INSERT OR REPLACE INTO mirror VALUES (?, ?, ?)",
+                        (e.model, e.object_pk, json.dumps(e.payload)),
+                    )
+            if events:
+                self.connection.execute(
+                    "UPDATE position SET event_id = ? WHERE id = 0", (events[-1].id,)
+                )
+        if events:
+            self._save_cursor()
+
+    def _save_cursor(self) -> None:
+        ChangeCursor.objects.update_or_create(
+            consumer=self.name, defaults={"position": self.position}
+        )
+
+    def sync(self) -> int:
+        """sync
+
+        Applies every event after the mirror's position.
+
+        Returns:
+            int: number of applied events
+        """
+        # register (or rewind) the cursor before reading so events are
+        # kept for a new or rebuilt mirror
+        self._save_cursor()
+        consumer: OutboxConsumer = OutboxConsumer(
+            self.name, batch_size=self.batch_size, gap_timeout=self.gap_timeout
+        )
+        count: int = 0
+        while events := consumer.read(after=self.position):
+            self.apply(events)
+            count += len(events)
+        return count
+
+    def get(self, model: str, object_pk: str) -> Optional[dict]:
+        """get
+
+        Args:
+            model (str): app_label.model_name
+            object_pk (str): primary key
+
+        Returns:
+            dict | None: the mirrored row
+        """
+        row: Optional[tuple] = self.connection.execute(
+            "SELECT payload FROM mirror WHERE model = ? AND object_pk = ?",
+            (model, object_pk),
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def count(self, model: str) -> int:
+        """count
+
+        Args:
+            model (str): app_label.model_name
+
+        Returns:
+            int: number of mirrored rows for `model`
+        """
+        return self.connection.execute(
+            "SELECT COUNT(*) FROM mirror WHERE model = ?", (model,)
+        ).fetchone()[0]
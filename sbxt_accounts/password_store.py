@@ -0,0 +1,456 @@
+"""accounts/password_store.py
+
+Versioned, sharded storage for the common passwords list used by
+:class:`sbxt_accounts.validators.CustomCommonPasswordValidator`.
+
+A store is a directory laid out as::
+
+    <root>/CURRENT                        manifest of the live generation
+    <root>/LOCK                           held while publishing or pruning
+    <root>/generations/manifest-<n>.json  manifest history
+    <root>/shards/shard-<i>-<digest>.txt.gz
+
+Shard files are content addressed, so publishing a new generation only
+writes the shards whose contents changed, and a running process only
+rereads those shards when it picks the new generation up.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+import zlib
+from contextlib import contextmanager
+from pathlib import Path
+from typing import IO, Iterable, Iterator, Optional
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - windows
+    fcntl = None
+    import msvcrt
+
+MANIFEST_NAME: str = "CURRENT"  #: name of the live manifest file
+LOCK_NAME: str = "LOCK"  #: name of the publisher lock file
+GENERATIONS_DIR: str = "generations"  #: manifest history directory
+SHARDS_DIR: str = "shards"  #: shard file directory
+DEFAULT_SHARD_COUNT: int = 16  #: shards used when none are requested
+LOAD_ATTEMPTS: int = 3  #: manifest rereads when a shard vanishes mid load
+
+
+def normalize_password(password: str) -> str:
+    """normalize_password
+
+    Normalizes a password the same way Django's
+    :class:`~django.contrib.auth.password_validation.CommonPasswordValidator`
+    does before comparing it to the list.
+
+    Args:
+        password (str): the raw password
+
+    Returns:
+        str: the lowercased password stripped of whitespace
+    """
+    return password.lower().strip()
+
+
+def shard_for(password: str, shard_count: int) -> int:
+    """shard_for
+
+    Args:
+        password (str): a normalized password
+        shard_count (int): number of shards in the generation
+
+    Returns:
+        int: index of the shard that holds `password`
+    """
+    return zlib.crc32(password.encode("utf-8")) % shard_count
+
+
+def read_password_file(path: str | Path) -> set[str]:
+    """read_password_file
+
+    Reads a plain text or gzipped password list with one password per line.
+
+    Args:
+        path (str | Path): path to the password list
+
+    Returns:
+        set[str]: the normalized passwords
+    """
+    try:
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            return {normalize_password(x) for x in f if x.strip()}
+    except OSError:
+        with open(path, encoding="utf-8") as f:
+            return {normalize_password(x) for x in f if x.strip()}
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    """write `data` to a temporary file and move it over `path`"""
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.unlink(tmp)
+        raise
+
+
+def _lock_file(f: IO[bytes]) -> None:
+    """block until this process holds an exclusive lock on `f`"""
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+    else:  # pragma: no cover - windows
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+
+
+def _unlock_file(f: IO[bytes]) -> None:
+    if fcntl is not None:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+    else:  # pragma: no cover - windows
+        f.seek(0)
+        msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class PasswordGeneration:
+    """PasswordGeneration
+
+    An immutable snapshot of one published password list generation.
+
+    Attributes:
+        number (int): the generation number
+        shard_names (tuple[str, ...]): shard file name for each shard index
+        shards (tuple[frozenset[str], ...]): passwords held by each shard
+    """
+
+    __slots__ = ("number", "shard_names", "shards")
+
+    def __init__(
+        self,
+        number: int,
+        shard_names: tuple[str, ...],
+        shards: tuple[frozenset[str], ...],
+    ) -> None:
+        self.number: int = number
+        self.shard_names: tuple[str, ...] = shard_names
+        self.shards: tuple[frozenset[str], ...] = shards
+
+    def __contains__(self, password: str) -> bool:
+        if not self.shards:
+            return False
+        password: str = normalize_password(password)
+        return password in self.shards[shard_for(password, len(self.shards))]
+
+    def __len__(self) -> int:
+        return sum(len(s) for s in self.shards)
+
+    def passwords(self) -> set[str]:
+        """passwords
+
+        Returns:
+            set[str]: every password in the generation
+        """
+        return set().union(*self.shards)
+
+
+EMPTY_GENERATION: PasswordGeneration = PasswordGeneration(0, (), ())
+"""generation used before anything has been published"""
+
+
+class PasswordListStore:
+    """PasswordListStore
+
+    Reads and publishes password list generations in a store directory.
+
+    Readers call :meth:`current`, which checks the manifest's file stamp at
+    most once every `check_interval` seconds and swaps a freshly loaded
+    :class:`PasswordGeneration` in when it changes. Shards that are shared
+    with the previous generation are reused rather than reread.
+
+    Args:
+        root (str | Path): store directory
+        check_interval (float): minimum seconds between manifest checks
+    """
+
+    def __init__(self, root: str | Path, check_interval: float = 1.0) -> None:
+        self.root: Path = Path(root)
+        self.check_interval: float = check_interval
+        self._generation: PasswordGeneration = EMPTY_GENERATION
+        self._stamp: Optional[tuple[int, int, int]] = None
+        self._checked_at: float = float("-inf")
+        self._lock: threading.Lock = threading.Lock()
+
+    # paths
+    @property
+    def manifest_path(self) -> Path:
+        return self.root / MANIFEST_NAME
+
+    @property
+    def shards_path(self) -> Path:
+        return self.root / SHARDS_DIR
+
+    @property
+    def generations_path(self) -> Path:
+        return self.root / GENERATIONS_DIR
+
+    # reading
+    def _manifest_stamp(self) -> Optional[tuple[int, int, int]]:
+        try:
+            st: os.stat_result = os.stat(self.manifest_path)
+        except FileNotFoundError:
+            return None
+        return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+    def read_manifest(self) -> Optional[dict]:
+        """read_manifest
+
+        Returns:
+            dict | None: the live manifest or `None` if nothing is published
+        """
+        try:
+            with open(self.manifest_path, encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    def _read_shard(self, name: str) -> frozenset[str]:
+        with gzip.open(self.shards_path / name, "rt", encoding="utf-8") as f:
+            return frozenset(x.rstrip("\n") for x in f if x.strip())
+
+    def _load(self, manifest: dict, previous: PasswordGeneration) -> PasswordGeneration:
+        reuse: dict[str, frozenset[str]] = dict(
+            zip(previous.shard_names, previous.shards)
+        )
+        names: tuple[str, ...] = tuple(manifest["shards"])
+        shards: tuple[frozenset[str], ...] = tuple(
+            reuse[n] if n in reuse else self._read_shard(n) for n in names
+        )
+        return PasswordGeneration(manifest["generation"], names, shards)
+
+    def refresh(self, force: bool = False) -> PasswordGeneration:
+        """refresh
+
+        Loads the live generation if the manifest changed since the last check.
+        If a shard is pruned while it is being loaded, the manifest is reread
+        and the load retried. Should that keep failing, the previously loaded
+        generation stays live until the next check.
+
+        Args:
+            force (bool): ignore `check_interval`
+
+        Returns:
+            PasswordGeneration: the live generation
+        """
+        now: float = time.monotonic()
+        if not force and now - self._checked_at < self.check_interval:
+            return self._generation
+        with self._lock:
+            self._checked_at = now
+            for _ in range(LOAD_ATTEMPTS):
+                stamp: Optional[tuple[int, int, int]] = self._manifest_stamp()
+                if stamp == self._stamp:
+                    return self._generation
+                manifest: Optional[dict] = self.read_manifest()
+                try:
+                    if manifest is None:
+                        generation: PasswordGeneration = EMPTY_GENERATION
+                    elif manifest["generation"] == self._generation.number:
+                        generation: PasswordGeneration = self._generation
+                    else:
+                        generation: PasswordGeneration = self._load(
+                            manifest, self._generation
+                        )
+                except FileNotFoundError:
+                    # a newer generation was published and this one's shards
+                    # pruned while it was loading, reread CURRENT
+                    continue
+                self._generation, self._stamp = generation, stamp
+                break
+        return self._generation
+
+    def current(self) -> PasswordGeneration:
+        """current
+
+        Returns:
+            PasswordGeneration: the live generation, refreshed if it is due
+        """
+        return self.refresh()
+
+    # publishing
+    @contextmanager
+    def locked(self) -> Iterator[None]:
+        """locked
+
+        Holds the store's lock file so only one process publishes or prunes
+        at a time. The lock is released if the process dies.
+        """
+        self.root.mkdir(parents=True, exist_ok=True)
+        with open(self.root / LOCK_NAME, "a+b") as f:
+            _lock_file(f)
+            try:
+                yield
+            finally:
+                _unlock_file(f)
+
+    def _write_shard(self, index: int, passwords: Iterable[str]) -> str:
+        body: bytes = "".join(f"{p}\n" for p in sorted(passwords)).encode("utf-8")
+        digest: str = hashlib.sha256(body).hexdigest()[:16]
+        name: str = f"shard-{index:03d}-{digest}.txt.gz"
+        path: Path = self.shards_path / name
+        if not path.exists():
+            _atomic_write(path, gzip.compress(body, mtime=0))
+        return name
+
+    def publish(
+        self,
+        passwords: Iterable[str],
+        shard_count: Optional[int] = None,
+    ) -> dict:
+        """publish
+
+        Compiles `passwords` into a new generation and makes it live. Holds
+        :meth:`locked` so concurrent publishers can not reuse a generation
+        number and overwrite each other.
+
+        Args:
+            passwords (Iterable[str]): the full password list
+            shard_count (int | None): number of shards, defaults to the
+                live generation's count or :data:`DEFAULT_SHARD_COUNT`
+
+        Returns:
+            dict: the published manifest
+        """
+        with self.locked():
+            return self._publish(passwords, shard_count)
+
+    def _publish(self, passwords: Iterable[str], shard_count: Optional[int]) -> dict:
+        previous: Optional[dict] = self.read_manifest()
+        if shard_count is None:
+            shard_count: int = (
+                len(previous["shards"]) if previous else DEFAULT_SHARD_COUNT
+            )
+        if shard_count < 1:
+            raise ValueError("shard_count must be at least 1")
+
+        buckets: list[set[str]] = [set() for _ in range(shard_count)]
+        for p in passwords:
+            p: str = normalize_password(p)
+            if p:
+                buckets[shard_for(p, shard_count)].add(p)
+
+        self.shards_path.mkdir(parents=True, exist_ok=True)
+        self.generations_path.mkdir(parents=True, exist_ok=True)
+        manifest: dict = {
+            "generation": (previous["generation"] + 1) if previous else 1,
+            "published": time.time(),
+            "count": sum(len(b) for b in buckets),
+            "shards": [self._write_shard(i, b) for i, b in enumerate(buckets)],
+        }
+        data: bytes = json.dumps(manifest, indent=2).encode("utf-8")
+        _atomic_write(
+            self.generations_path / f"manifest-{manifest['generation']:06d}.json",
+            data,
+        )
+        _atomic_write(self.manifest_path, data)
+        return manifest
+
+    def publish_delta(
+        self,
+        add: Iterable[str] = (),
+        remove: Iterable[str] = (),
+    ) -> dict:
+        """publish_delta
+
+        Publishes a new generation made from the live one plus `add` and
+        minus `remove`. Only shards touched by the delta are rewritten.
+
+        Args:
+            add (Iterable[str]): passwords to add
+            remove (Iterable[str]): passwords to remove
+
+        Returns:
+            dict: the published manifest
+        """
+        with self.locked():
+            live: PasswordGeneration = self.refresh(force=True)
+            passwords: set[str] = live.passwords()
+            passwords |= {normalize_password(p) for p in add}
+            passwords -= {normalize_password(p) for p in remove}
+            return self._publish(
+                passwords, shard_count=len(live.shards) or DEFAULT_SHARD_COUNT
+            )
+
+    def prune(self, keep: int = 2) -> list[str]:
+        """prune
+
+        Removes manifests and shard files that are not used by the newest
+        `keep` generations. Older generations are kept around so processes
+        that are still loading them are not left without a file.
+
+        Args:
+            keep (int): number of generations to keep
+
+        Returns:
+            list[str]: names of the removed files
+        """
+        if keep < 1:
+            raise ValueError("keep must be at least 1")
+        if not self.generations_path.exists():
+            return []
+        # shards of an in-flight publish are not referenced by a manifest yet
+        with self.locked():
+            return self._prune(keep)
+
+    def _prune(self, keep: int) -> list[str]:
+        manifests: list[Path] = sorted(self.generations_path.glob("manifest-*.json"))
+        kept, dropped = manifests[-keep:], manifests[:-keep]
+        live: set[str] = set()
+        for path in kept:
+            with open(path, encoding="utf-8") as f:
+                live.update(json.load(f)["shards"])
+
+        removed: list[str] = []
+        for path in dropped:
+            path.unlink()
+            removed.append(path.name)
+        for path in self.shards_path.glob("shard-*.txt.gz"):
+            if path.name not in live:
+                path.unlink()
+                removed.append(path.name)
+        return removed
+
+
+_stores: dict[str, PasswordListStore] = {}  #: stores shared by this process
+_stores_lock: threading.Lock = threading.Lock()
+
+
+def get_password_store(
+    root: str | Path,
+    check_interval: float = 1.0,
+) -> PasswordListStore:
+    """get_password_store
+
+    Returns the process wide :class:`PasswordListStore` for `root` so every
+    validator instance shares one loaded generation.
+
+    Args:
+        root (str | Path): store directory
+        check_interval (float): minimum seconds between manifest checks
+
+    Returns:
+        PasswordListStore: the shared store
+    """
+    key: str = os.path.abspath(root)
+    with _stores_lock:
+        if key not in _stores:
+            _stores[key] = PasswordListStore(key, check_interval=check_interval)
+        return _stores[key]
@@ -0,0 +1,364 @@
+"""accounts/purge.py
+
+Batched archiving and purging of closed accounts.
+
+Deleting an account one object at a time cascades through its profile,
+profile image and permission links and holds locks for the whole run.
+:class:`PurgeEngine` instead works through the candidates in bounded
+batches: each batch is archived, its link rows, profiles and accounts are
+deleted with a handful of set-based queries in one short transaction, its
+media files are removed once the transaction commits, and the engine
+pauses before the next batch.
+
+The deletes skip Django's per-object collector, so no ``post_delete``
+signals fire. The batch's outbox events are written with one
+``bulk_create`` instead.
+"""
+
+import gzip
+import json
+import math
+import os
+import time
+from datetime import timedelta
+from typing import Callable, Optional
+from django.core.files.storage import Storage
+from django.db import transaction
+from django.db.models import CASCADE, DO_NOTHING, PROTECT, RESTRICT, Q, QuerySet
+from django.db.models.deletion import Collector, ProtectedError
+from django.utils import timezone
+from sbxt_accounts.models import (
+    AccountProfile,
+    ArchivedAccount,
+    ChangeEvent,
+    CustomAccount,
+    LoginEvent,
+    LoginRollup,
+)
+
+
+def read_archive_file(path: str) -> list[dict]:
+    """read_archive_file
+
+    Reads a gzipped JSON lines archive written by :class:`PurgeEngine`. A
+    batch that was archived and then rolled back is archived again by the
+    next run, so records are deduplicated on username, keeping the last.
+
+    Args:
+        path (str): the archive file
+
+    Returns:
+        list[dict]: one record per purged account
+    """
+    records: dict[str, dict] = {}
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                record: dict = json.loads(line)
+                records[record["username"]] = record
+    return list(records.values())
+
+
+class PurgeReport:
+    """PurgeReport
+
+    Progress and totals of a purge run, or the estimate of a dry run.
+
+    Attributes:
+        candidates (int): accounts matched when the run started
+        accounts (int): accounts deleted (or that would be)
+        profiles (int): profiles deleted
+        group_links (int): account/group rows deleted
+        permission_links (int): account/permission rows deleted
+        media_files (int): profile images removed
+        login_history (int): login events and rollups deleted
+        archived (int): archive records written
+        batches (int): batches processed (or needed)
+        elapsed (float): seconds spent, estimated seconds for a dry run
+        dry_run (bool): `True` if nothing was changed
+    """
+
+    def __init__(self, candidates: int = 0, dry_run: bool = False) -> None:
+        self.candidates: int = candidates
+        self.accounts: int = 0
+        self.profiles: int = 0
+        self.group_links: int = 0
+        self.permission_links: int = 0
+        self.media_files: int = 0
+        self.login_history: int = 0
+        self.archived: int = 0
+        self.batches: int = 0
+        self.elapsed: float = 0.0
+        self.dry_run: bool = dry_run
+
+    def __str__(self) -> str:
+        verb: str = "would delete" if self.dry_run else "deleted"
+        return (
+            f"{verb} {self.accounts}/{self.candidates} accounts, "
+            f"{self.profiles} profiles, {self.group_links} group links, "
+            f"{self.permission_links} permission links, "
+            f"{self.login_history} login history rows, "
+            f"{self.media_files} media files in {self.batches} batches "
+            f"({self.archived} archived, {self.elapsed:.1f}s)"
+        )
+
+
+class PurgeEngine:
+    """PurgeEngine
+
+    Archives and deletes inactive accounts in bounded batches.
+
+    An account is a candidate when it is inactive, not a superuser, and
+    has not logged in (or joined, if it never logged in) for
+    `inactive_days`.
+
+    Example::
+
+        >>> engine = PurgeEngine(inactive_days=365, batch_size=200, pause=1)
+        >>> print(engine.estimate())
+        would delete 1200/1200 accounts, ... in 6 batches (0 archived, 6.0s)
+        >>> engine.run()
+
+    Args:
+        inactive_days (int): days without a login before an account is purged
+        batch_size (int): accounts deleted per transaction
+        pause (float): seconds to sleep between batches
+        archive (bool): write :class:`ArchivedAccount` rows
+        archive_file (str | None): append gzipped JSON lines to this file
+            instead of writing :class:`ArchivedAccount` rows, read it back
+            with :func:`read_archive_file`
+        dry_run (bool): only estimate, see :meth:`estimate`
+        progress (Callable | None): called with the report after each batch
+    """
+
+    def __init__(
+        self,
+        inactive_days: int = 365,
+        batch_size: int = 100,
+        pause: float = 0.5,
+        archive: bool = True,
+        archive_file: Optional[str] = None,
+        dry_run: bool = False,
+        progress: Optional[Callable[[PurgeReport], None]] = None,
+    ) -> None:
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        self.cutoff = timezone.now() - timedelta(days=inactive_days)
+        self.batch_size: int = batch_size
+        self.pause: float = pause
+        self.archive: bool = archive
+        self.archive_file: Optional[str] = archive_file
+        self.dry_run: bool = dry_run
+        self.progress: Optional[Callable[[PurgeReport], None]] = progress
+
+    def candidates(self) -> QuerySet:
+        """candidates
+
+        Returns:
+            QuerySet: the accounts to purge
+        """
+        return CustomAccount.objects.filter(
+            Q(last_login__lt=self.cutoff)
+            | Q(last_login__isnull=True, date_joined__lt=self.cutoff),
+            is_active=False,
+            is_superuser=False,
+        ).order_by("pk")
+
+    @staticmethod
+    def _media_names(profiles: QuerySet) -> list[str]:
+        default: str = AccountProfile._meta.get_field("profile_pic").get_default()
+        return [
+            n
+            for n in profiles.exclude(profile_pic="")
+            .exclude(profile_pic__isnull=True)
+            .values_list("profile_pic", flat=True)
+            if n != default
+        ]
+
+    def estimate(self) -> PurgeReport:
+        """estimate
+
+        Counts what a run would delete without changing anything. The time
+        estimate only covers the pauses between batches.
+
+        Returns:
+            PurgeReport: the dry run report
+        """
+        ids: QuerySet = self.candidates().values("pk")
+        usernames: QuerySet = self.candidates().values("username")
+        report: PurgeReport = PurgeReport(self.candidates().count(), dry_run=True)
+        report.accounts = report.candidates
+        profiles: QuerySet = AccountProfile.objects.filter(user_id__in=usernames)
+        report.profiles = profiles.count()
+        report.group_links = CustomAccount.groups.through.objects.filter(
+            customaccount_id__in=ids
+        ).count()
+        report.permission_links = CustomAccount.user_permissions.through.objects.filter(
+            customaccount_id__in=ids
+        ).count()
+        report.media_files = len(self._media_names(profiles))
+        report.login_history = (
+            LoginEvent.objects.filter(username__in=usernames).count()
+            + LoginRollup.objects.filter(username__in=usernames).count()
+        )
+        report.archived = report.accounts if self.archive else 0
+        report.batches = math.ceil(report.accounts / self.batch_size)
+        report.elapsed = max(0, report.batches - 1) * self.pause
+        return report
+
+    def _archive(self, accounts: list[CustomAccount]) -> list[ArchivedAccount]:
+        ids: list[int] = [a.pk for a in accounts]
+        groups: dict[int, list[str]] = {}
+        for pk, name in CustomAccount.groups.through.objects.filter(
+            customaccount_id__in=ids
+        ).values_list("customaccount_id", "group__name"):
+            groups.setdefault(pk, []).append(name)
+        permissions: dict[int, list[str]] = {}
+        for pk, app, codename in CustomAccount.user_permissions.through.objects.filter(
+            customaccount_id__in=ids
+        ).values_list(
+            "customaccount_id",
+            "permission__content_type__app_label",
+            "permission__codename",
+        ):
+            permissions.setdefault(pk, []).append(f"{app}.{codename}")
+        profiles: dict[str, AccountProfile] = {
+            p.pk: p
+            for p in AccountProfile.objects.filter(
+                user_id__in=[a.username for a in accounts]
+            )
+        }
+
+        records: list[ArchivedAccount] = [
+            ArchivedAccount(
+                username=a.username,
+                account=ChangeEvent.objects.serialize(a),
+                profile=(
+                    ChangeEvent.objects.serialize(profiles[a.username])
+                    if a.username in profiles
+                    else None
+                ),
+                groups=groups.get(a.pk, []),
+                permissions=permissions.get(a.pk, []),
+            )
+            for a in accounts
+        ]
+        if not self.archive_file:
+            ArchivedAccount.objects.bulk_create(records)
+        return records
+
+    def _write_archive_file(self, records: list[ArchivedAccount]) -> None:
+        """append `records` to the archive file and flush them to disk"""
+        lines: str = "".join(json.dumps(r.as_dict()) + "\n" for r in records)
+        with open(self.archive_file, "ab") as raw:
+            with gzip.GzipFile(fileobj=raw, mode="ab") as f:
+                f.write(lines.encode("utf-8"))
+            raw.flush()
+            os.fsync(raw.fileno())
+
+    @staticmethod
+    def _delete_related(accounts: list[CustomAccount]) -> None:
+        """clear rows of other apps that point at the accounts"""
+        for rel in CustomAccount._meta.related_objects:
+            if rel.related_model is AccountProfile:
+                continue
+            if rel.many_to_many:
+                link = rel.through._meta.get_field(rel.field.m2m_reverse_field_name())
+                attname: str = link.target_field.attname
+                rel.through._base_manager.filter(
+                    **{f"{link.name}__in": [getattr(a, attname) for a in accounts]}
+                ).delete()
+                continue
+            # the foreign key may point at a field other than the pk
+            attname: str = rel.field.target_field.attname
+            rows: QuerySet = rel.related_model._base_manager.filter(
+                **{f"{rel.field.name}__in": [getattr(a, attname) for a in accounts]}
+            )
+            if rel.on_delete is DO_NOTHING:
+                continue
+            if rel.on_delete in (PROTECT, RESTRICT):
+                if rows.exists():
+                    raise ProtectedError(
+                        f"accounts are referenced by {rel.related_model._meta.label}",
+                        set(rows),
+                    )
+            elif rel.on_delete is CASCADE:
+                rows.delete()
+            else:
+                # SET_NULL, SET_DEFAULT and SET(...) re-point the rows
+                collector: Collector = Collector(using=rows.db)
+                rel.on_delete(collector, rel.field, rows, rows.db)
+                collector.delete()
+
+    def _purge_batch(self, ids: list[int], report: PurgeReport) -> None:
+        storage: Storage = AccountProfile._meta.get_field("profile_pic").storage
+
+        with transaction.atomic():
+            # an account may have logged in or been reactivated since `ids`
+            # was read, so check and lock the candidates again
+            accounts: list[CustomAccount] = list(
+                self.candidates().filter(pk__in=ids).select_for_update()
+            )
+            if not accounts:
+                return
+            ids: list[int] = [a.pk for a in accounts]
+            usernames: list[str] = [a.username for a in accounts]
+            profiles: QuerySet = AccountProfile.objects.filter(user_id__in=usernames)
+
+            if self.archive:
+                records: list[ArchivedAccount] = self._archive(accounts)
+                if self.archive_file:
+                    # written before the deletes so a failure rolls the
+                    # batch back; a rolled back batch is archived again
+                    self._write_archive_file(records)
+                report.archived += len(records)
+            media: list[str] = self._media_names(profiles)
+            profile_pks: list[str] = list(profiles.values_list("pk", flat=True))
+            ChangeEvent.objects.record_many(
+                [AccountProfile(pk=pk) for pk in profile_pks] + accounts,
+                ChangeEvent.DELETE,
+            )
+            report.group_links += CustomAccount.groups.through.objects.filter(
+                customaccount_id__in=ids
+            ).delete()[0]
+            report.permission_links += (
+                CustomAccount.user_permissions.through.objects.filter(
+                    customaccount_id__in=ids
+                ).delete()[0]
+            )
+            report.login_history += (
+                LoginEvent.objects.filter(username__in=usernames).delete()[0]
+                + LoginRollup.objects.filter(username__in=usernames).delete()[0]
+            )
+            self._delete_related(accounts)
+            report.profiles += profiles._raw_delete(profiles.db)
+            accounts_qs: QuerySet = CustomAccount.objects.filter(pk__in=ids)
+            report.accounts += accounts_qs._raw_delete(accounts_qs.db)
+            # only remove files once the rows are really gone
+            transaction.on_commit(lambda: [storage.delete(n) for n in media])
+        report.media_files += len(media)
+
+    def run(self) -> PurgeReport:
+        """run
+
+        Purges every candidate, one batch at a time.
+
+        Returns:
+            PurgeReport: totals for the run, or the estimate for a dry run
+        """
+        if self.dry_run:
+            return self.estimate()
+
+        started: float = time.monotonic()
+        report: PurgeReport = PurgeReport(self.candidates().count())
+        while ids := list(
+            self.candidates().values_list("pk", flat=True)[: self.batch_size]
+        ):
+            if report.batches and self.pause:
+                time.sleep(self.pause)
+            self._purge_batch(ids, report)
+            report.batches += 1
+            report.elapsed = time.monotonic() - started
+            if self.progress is not None:
+                self.progress(report)
+        return report
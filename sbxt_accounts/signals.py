@@ -0,0 +1,38 @@
+# accounts/signals.py
+
+from django.db.models import Model
+from sbxt_accounts.models import ChangeEvent
+
+IGNORED_UPDATE_FIELDS: frozenset[str] = frozenset(
+    {"last_login"}
+)  #: saves that only touch these fields write no event
+
+
+def record_save(
+    sender: type[Model], instance: Model, created: bool, raw: bool, **kwargs
+) -> None:
+    """record_save
+
+    ``post_save`` receiver that writes a :class:`ChangeEvent` for the saved
+    instance. Model ``save`` methods run inside ``transaction.atomic`` so
+    the event commits with the change.
+    """
+    if raw:
+        # fixtures are loaded as-is
+        return
+    update_fields = kwargs.get("update_fields")
+    if update_fields is not None and set(update_fields) <= IGNORED_UPDATE_FIELDS:
+        # update_last_login on every login, which login history covers
+        return
+    ChangeEvent.objects.record(
+        instance, ChangeEvent.CREATE if created else ChangeEvent.UPDATE
+    )
+
+
+def record_delete(sender: type[Model], instance: Model, **kwargs) -> None:
+    """record_delete
+
+    ``post_delete`` receiver that writes a :class:`ChangeEvent` for the
+    deleted instance inside the deletion's transaction.
+    """
+    ChangeEvent.objects.record(instance, ChangeEvent.DELETE)
@@ -0,0 +1,182 @@
+"""sbxt_accounts/tests/factories.py
+
+Fast factories for :ref:`sbxt_accounts.models.CustomAccount` and
+:ref:`sbxt_accounts.models.AccountProfile` test data.
+
+Passwords are hashed once per (password, hasher) and reused, and
+batches are written with a single ``bulk_create``, so the factories are
+cheap enough to call from ``setUpTestData``::
+
+    class MyTestCase(TestCase):
+        @classmethod
+        def setUpTestData(cls):
+            cls.accounts = AccountFactory.create_batch(50)
+            cls.profiles = ProfileFactory.create_batch(cls.accounts)
+
+Downstream test settings can also swap in a fast hasher::
+
+    from sbxt_accounts.tests.factories import FAST_PASSWORD_HASHERS
+
+    PASSWORD_HASHERS = FAST_PASSWORD_HASHERS
+
+"""
+
+from functools import lru_cache
+from typing import Iterable, Optional
+from django.contrib.auth.hashers import get_hasher, make_password
+from sbxt_accounts.models import CustomAccount as User, AccountProfile
+from sbxt_accounts.utils import normalize_username
+
+FAST_PASSWORD_HASHERS: list[str] = [
+    "django.contrib.auth.hashers.MD5PasswordHasher",
+]  #: a cheap hasher for test settings, never use it in production
+DEFAULT_PASSWORD: str = "P@55w0rd"  #: password given to factory accounts
+
+
+@lru_cache(maxsize=None)
+def _hash(password: str, algorithm: str) -> str:
+    return make_password(password, hasher=algorithm)
+
+
+def hashed_password(password: str = DEFAULT_PASSWORD) -> str:
+    """hashed_password
+
+    Hashes `password` with the default hasher once and reuses the result
+    for every later call, so only the first account pays for the hash.
+
+    Args:
+        password (str): the raw password
+
+    Returns:
+        str: the encoded password
+    """
+    return _hash(password, get_hasher("default").algorithm)
+
+
+class AccountFactory:
+    """AccountFactory
+
+    Builds and saves :class:`sbxt_accounts.models.CustomAccount` instances
+    with precomputed password hashes.
+    """
+
+    prefix: str = "testuser"  #: username prefix for generated usernames
+
+    @classmethod
+    def build(
+        cls,
+        username: str,
+        password: str = DEFAULT_PASSWORD,
+        **fields,
+    ) -> User:
+        """build
+
+        Args:
+            username (str): username, normalized like `CustomAccount.save`
+            password (str): raw password
+            **fields (dict): additional model fields with data
+
+        Returns:
+            User: an unsaved account
+        """
+        return User(
+            username=normalize_username(username),
+            password=hashed_password(password),
+            **fields,
+        )
+
+    @classmethod
+    def create(
+        cls,
+        username: str,
+        password: str = DEFAULT_PASSWORD,
+        **fields,
+    ) -> User:
+        """create
+
+        Returns:
+            User: a saved account, see :meth:`build`
+        """
+        user: User = cls.build(username, password, **fields)
+        user.save()
+        return user
+
+    @classmethod
+    def create_batch(
+        cls,
+        count: int,
+        prefix: Optional[str] = None,
+        password: str = DEFAULT_PASSWORD,
+        **fields,
+    ) -> list[User]:
+        """create_batch
+
+        Saves `count` accounts named ``<prefix>0000``, ``<prefix>0001``, ...
+        with one query.
+
+        Args:
+            count (int): number of accounts
+            prefix (str | None): username prefix, defaults to :attr:`prefix`
+            password (str): raw password for every account
+            **fields (dict): additional model fields with data
+
+        Returns:
+            list[User]: the saved accounts
+        """
+        prefix: str = cls.prefix if prefix is None else prefix
+        return User.objects.bulk_create(
+            [cls.build(f"{prefix}{i:04d}", password, **fields) for i in range(count)]
+        )
+
+
+class ProfileFactory:
+    """ProfileFactory
+
+    Builds and saves :class:`sbxt_accounts.models.AccountProfile` instances
+    """
+
+    email_domain: str = "test.dev"  #: domain for generated email addresses
+
+    @classmethod
+    def build(cls, user: User, **fields) -> AccountProfile:
+        """build
+
+        Args:
+            user (User): the profile's account
+            **fields (dict): additional model fields with data
+
+        Returns:
+            AccountProfile: an unsaved profile
+        """
+        fields.setdefault("first_name", "Test")
+        fields.setdefault("last_name", user.username)
+        fields.setdefault("email", f"{user.username}@{cls.email_domain}")
+        return AccountProfile(user=user, slug=user.get_slug(), **fields)
+
+    @classmethod
+    def create(cls, user: User, **fields) -> AccountProfile:
+        """create
+
+        Returns:
+            AccountProfile: a saved profile, see :meth:`build`
+        """
+        profile: AccountProfile = cls.build(user, **fields)
+        profile.save()
+        return profile
+
+    @classmethod
+    def create_batch(cls, users: Iterable[User], **fields) -> list[AccountProfile]:
+        """create_batch
+
+        Saves one profile for each of `users` with one query.
+
+        Args:
+            users (Iterable[User]): the profiles' accounts
+            **fields (dict): additional model fields with data
+
+        Returns:
+            list[AccountProfile]: the saved profiles
+        """
+        return AccountProfile.objects.bulk_create(
+            [cls.build(u, **fields) for u in users]
+        )
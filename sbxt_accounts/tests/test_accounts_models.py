@@ -6,11 +6,14 @@ Run these specific tests with ::
 
 """
 
-from django.test import TestCase
-from sbxt_accounts.models import CustomAccount, AccountProfile
+from django.db import IntegrityError
+from django.test import TestCase, override_settings
+from sbxt_accounts.models import ChangeEvent, CustomAccount, AccountProfile
+from .factories import FAST_PASSWORD_HASHERS, AccountFactory, ProfileFactory
 from .test_utils import TestUtils
 
 
+@override_settings(PASSWORD_HASHERS=FAST_PASSWORD_HASHERS)
 class CustomAccountTestCase(TestCase):
     """CustomAccountTestCase
 
@@ -18,20 +21,21 @@ class CustomAccountTestCase(TestCase):
 
     """
 
-    def setUp(self):
-        """setUp
+    @classmethod
+    def setUpTestData(cls):
+        """setUpTestData
 
         Set up the :class:`CustomAccountTestCase`
 
-        creates users for testing:
+        creates users for testing once for the whole suite:
             - superuser
             - staff user
             - normal user
         """
 
-        self.superuser: CustomAccount.objects = TestUtils.get_superuser()
-        self.staffuser: CustomAccount.objects = TestUtils.get_staff_user()
-        self.normal_usr: CustomAccount.objects = TestUtils.get_normal_user()
+        cls.superuser: CustomAccount.objects = TestUtils.get_superuser()
+        cls.staffuser: CustomAccount.objects = TestUtils.get_staff_user()
+        cls.normie: CustomAccount.objects = TestUtils.get_normal_user()
 
     def test_no_username_raises_ValueError(self) -> None:
         """test_no_username_raises_ValueError(self)
@@ -179,6 +183,62 @@ class CustomAccountTestCase(TestCase):
         self.assertIsNotNone(nu.date_joined)
 
 
+@override_settings(PASSWORD_HASHERS=FAST_PASSWORD_HASHERS)
+class CustomAccountUsernameTestCase(TestCase):
+    """CustomAccountUsernameTestCase
+
+    TestCase suite for username normalization and the ``LOWER(username)``
+    unique constraint on :class:`sbxt_accounts.models.CustomAccount`
+
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.normie: CustomAccount.objects = TestUtils.get_normal_user()
+        cls.staffuser: CustomAccount.objects = TestUtils.get_staff_user()
+
+    def test_get_by_natural_key_ignores_case(self):
+        self.assertEqual(
+            CustomAccount.objects.get_by_natural_key("NoRmIe"),
+            self.normie,
+        )
+
+    def test_get_by_natural_key_missing_raises_DoesNotExist(self):
+        with self.assertRaises(CustomAccount.DoesNotExist):
+            CustomAccount.objects.get_by_natural_key("nobody_here")
+
+    def test_create_user_normalizes_username(self):
+        user = CustomAccount.objects.create_user(
+            username="Another User", password="P@55w0rd"
+        )
+        self.assertEqual(user.username, "another_user")
+
+    def test_create_superuser(self):
+        su = CustomAccount.objects.create_superuser(
+            username="RootUser", password="P@55w0rd"
+        )
+        self.assertEqual(su.username, "rootuser")
+        self.assertTrue(su.is_superuser)
+
+    def test_bulk_create_normalizes_username(self):
+        (user,) = CustomAccount.objects.bulk_create(
+            [CustomAccount(username="BulkUser1")]
+        )
+        self.assertEqual(user.username, "bulkuser1")
+
+    def test_bulk_update_normalizes_username(self):
+        (user,) = CustomAccount.objects.bulk_create([CustomAccount(username="bulk2")])
+        user.username = " BulkUser2 "
+        CustomAccount.objects.bulk_update([user], ["username"])
+        user.refresh_from_db()
+        self.assertEqual(user.username, "bulkuser2")
+
+    def test_database_rejects_case_variant(self):
+        with self.assertRaises(IntegrityError):
+            CustomAccount.objects.filter(pk=self.staffuser.pk).update(username="NORMIE")
+
+
+@override_settings(PASSWORD_HASHERS=FAST_PASSWORD_HASHERS)
 class AccountProfileTestCase(TestCase):
     """AccountProfileTestCase(TestCase)
 
@@ -186,9 +246,12 @@ class AccountProfileTestCase(TestCase):
 
     """
 
+    @classmethod
+    def setUpTestData(cls):
+        cls.user: CustomAccount.objects = TestUtils.get_normal_user()
+
     def setUp(self):
         # normal user information
-        self.user: CustomAccount.objects = TestUtils.get_normal_user()
         self.fn: str = "Normal"
         self.ln: str = "User"
         self.e: str = "normaluser@test.dev"
@@ -231,3 +294,55 @@ class AccountProfileTestCase(TestCase):
 
     def test_profile_is_not_public(self):
         self.assertFalse(self.profile.is_public)
+
+
+class AccountProfileContactTestCase(TestCase):
+    """AccountProfileContactTestCase
+
+    TestCase suite for the normalized contact columns of
+    :class:`sbxt_accounts.models.AccountProfile`
+
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        accounts = AccountFactory.create_batch(4)
+        cls.profiles: list[AccountProfile] = ProfileFactory.create_batch(
+            accounts[:3], phone="+1 804 444 8888"
+        )
+        cls.other: AccountProfile = ProfileFactory.create(
+            accounts[3], email="TestUser0000+dupe@test.dev"
+        )
+
+    def test_bulk_create_normalizes_contacts(self):
+        self.assertEqual(self.profiles[0].phone_e164, "+18044448888")
+        self.assertEqual(self.profiles[0].email_canonical, "testuser0000@test.dev")
+
+    def test_save_normalizes_contacts(self):
+        self.assertEqual(self.other.phone_e164, "")
+        self.assertEqual(self.other.email_canonical, "testuser0000@test.dev")
+
+        self.other.phone = "+18045550000"
+        self.other.save(update_fields=["phone"])
+        self.other.refresh_from_db()
+        self.assertEqual(self.other.phone_e164, "+18045550000")
+
+    def test_bulk_update_normalizes_contacts(self):
+        self.profiles[0].email = "Fresh@Test.dev"
+        AccountProfile.objects.bulk_update(self.profiles[:1], ["email"])
+        self.profiles[0].refresh_from_db()
+        self.assertEqual(self.profiles[0].email_canonical, "fresh@test.dev")
+        event = ChangeEvent.objects.latest()
+        self.assertEqual(event.action, ChangeEvent.UPDATE)
+        self.assertEqual(event.object_pk, self.profiles[0].pk)
+        self.assertEqual(event.payload["email_canonical"], "fresh@test.dev")
+
+    def test_duplicate_clusters(self):
+        self.assertEqual(
+            list(AccountProfile.objects.duplicate_clusters("phone")),
+            [("+18044448888", ["testuser0000", "testuser0001", "testuser0002"])],
+        )
+        self.assertEqual(
+            list(AccountProfile.objects.duplicate_clusters("email")),
+            [("testuser0000@test.dev", ["testuser0000", "testuser0003"])],
+        )
@@ -1,2 +1,24 @@
-"""sbxt_accounts/tests/test_accounts_utils.py
-"""
+"""sbxt_accounts/tests/test_accounts_utils.py"""
+
+from django.test import SimpleTestCase
+from sbxt_accounts.utils import canonical_email, normalize_phone
+
+
+class ContactUtilsTestCase(SimpleTestCase):
+    """ContactUtilsTestCase
+
+    TestCase suite for :func:`sbxt_accounts.utils.canonical_email` and
+    :func:`sbxt_accounts.utils.normalize_phone`
+
+    """
+
+    def test_canonical_email(self):
+        self.assertEqual(canonical_email(" Normie+News@Test.dev "), "normie@test.dev")
+        self.assertEqual(canonical_email("normie@test.dev"), "normie@test.dev")
+        self.assertEqual(canonical_email(None), "")
+
+    def test_normalize_phone(self):
+        self.assertEqual(normalize_phone("+1 (804) 444-8888"), "+18044448888")
+        self.assertEqual(normalize_phone("804-444-8888", region="US"), "+18044448888")
+        self.assertEqual(normalize_phone("not a number"), "")
+        self.assertEqual(normalize_phone(""), "")
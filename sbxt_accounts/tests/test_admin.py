@@ -0,0 +1,106 @@
+"""TestCases for :ref:`sbxt_accounts.admin`
+
+Run these specific tests with ::
+
+    python manage.py test sbxt_accounts.tests.test_admin
+
+"""
+
+from django.contrib.auth.models import Group, Permission
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from sbxt_accounts.models import CustomAccount
+from .factories import AccountFactory, ProfileFactory
+from .test_utils import TestUtils
+
+
+@override_settings(ROOT_URLCONF="sbxt_accounts.tests.urls")
+class CustomAccountAdminTestCase(TestCase):
+    """CustomAccountAdminTestCase
+
+    TestCase suite for :class:`sbxt_accounts.admin.CustomAccountAdmin`
+
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.superuser: CustomAccount = TestUtils.get_superuser()
+        cls.group: Group = Group.objects.create(name="members")
+        cls.group.permissions.set(Permission.objects.all()[:3])
+
+    def setUp(self):
+        self.client.force_login(self.superuser)
+
+    def add_accounts(self, count: int, prefix: str) -> None:
+        accounts = AccountFactory.create_batch(count, prefix=prefix)
+        permission = Permission.objects.first()
+        for a in accounts:
+            a.groups.add(self.group)
+            a.user_permissions.add(permission)
+
+    def changelist_queries(self, model: str = "customaccount") -> int:
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(reverse(f"admin:accounts_{model}_changelist"))
+        self.assertEqual(response.status_code, 200)
+        return len(queries)
+
+    def test_add_form_hashes_password(self):
+        response = self.client.post(
+            reverse("admin:accounts_customaccount_add"),
+            {
+                "username": "adminadded",
+                "password1": "plaintext123",
+                "password2": "plaintext123",
+            },
+        )
+        self.assertEqual(response.status_code, 302)
+        account = CustomAccount.objects.get(username="adminadded")
+        self.assertNotEqual(account.password, "plaintext123")
+        self.assertTrue(account.check_password("plaintext123"))
+
+    def test_change_form_does_not_set_raw_password(self):
+        account = AccountFactory.create("changeduser")
+        encoded = account.password
+        response = self.client.post(
+            reverse("admin:accounts_customaccount_change", args=[account.pk]),
+            {
+                "username": "changeduser",
+                "password": "plaintext123",
+                "is_active": "on",
+                "date_joined_0": "2024-01-01",
+                "date_joined_1": "00:00:00",
+            },
+        )
+        self.assertEqual(response.status_code, 302)
+        account.refresh_from_db()
+        self.assertEqual(account.password, encoded)
+
+        response = self.client.post(
+            reverse("admin:auth_user_password_change", args=[account.pk]),
+            {"password1": "n3w-P@55w0rd", "password2": "n3w-P@55w0rd"},
+        )
+        self.assertEqual(response.status_code, 302)
+        account.refresh_from_db()
+        self.assertTrue(account.check_password("n3w-P@55w0rd"))
+
+    def test_with_summaries(self):
+        self.add_accounts(2, "summaryuser")
+        account = CustomAccount.objects.with_summaries().get(username="summaryuser0000")
+        self.assertEqual(account.status_label, account.status())
+        self.assertEqual(account.group_count, 1)
+        self.assertEqual(account.permission_count, 1)
+        self.assertEqual(account.group_permission_count, 3)
+
+    def test_changelist_queries_do_not_grow_with_rows(self):
+        self.add_accounts(3, "fewusers")
+        few = self.changelist_queries()
+        self.add_accounts(30, "manyusers")
+        self.assertEqual(self.changelist_queries(), few)
+
+    def test_profile_changelist_queries_do_not_grow_with_rows(self):
+        ProfileFactory.create_batch(AccountFactory.create_batch(3, prefix="fewusers"))
+        few = self.changelist_queries("accountprofile")
+        ProfileFactory.create_batch(AccountFactory.create_batch(30, prefix="manyusers"))
+        self.assertEqual(self.changelist_queries("accountprofile"), few)
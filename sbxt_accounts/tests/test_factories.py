@@ -0,0 +1,43 @@
+"""TestCases for :ref:`sbxt_accounts.tests.factories`
+
+Run these specific tests with ::
+
+    python manage.py test sbxt_accounts.tests.test_factories
+
+"""
+
+from django.test import TestCase
+from sbxt_accounts.models import CustomAccount, AccountProfile
+from .factories import AccountFactory, ProfileFactory, hashed_password
+
+
+class FactoriesTestCase(TestCase):
+    """FactoriesTestCase
+
+    TestCase suite for :class:`AccountFactory` and :class:`ProfileFactory`
+
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.accounts: list[CustomAccount] = AccountFactory.create_batch(10)
+        cls.profiles: list[AccountProfile] = ProfileFactory.create_batch(cls.accounts)
+
+    def test_batch_is_saved(self):
+        self.assertEqual(CustomAccount.objects.count(), 10)
+        self.assertEqual(AccountProfile.objects.count(), 10)
+
+    def test_batch_accounts_can_log_in(self):
+        account = CustomAccount.objects.get(username="testuser0003")
+        self.assertTrue(account.check_password("P@55w0rd"))
+
+    def test_password_hash_is_reused(self):
+        self.assertEqual(hashed_password("s3cr3t!!"), hashed_password("s3cr3t!!"))
+
+    def test_usernames_are_normalized(self):
+        self.assertEqual(AccountFactory.create("Mixed Case").username, "mixed_case")
+
+    def test_profile_links_to_account(self):
+        profile = AccountProfile.objects.get(user=self.accounts[0])
+        self.assertEqual(profile.slug, "testuser0000")
+        self.assertEqual(profile.email, "testuser0000@test.dev")
@@ -0,0 +1,122 @@
+"""TestCases for :ref:`sbxt_accounts.login_history`
+
+Run these specific tests with ::
+
+    python manage.py test sbxt_accounts.tests.test_login_history
+
+"""
+
+from datetime import timedelta
+from unittest import mock
+from django.db import DatabaseError, transaction
+from django.test import TestCase
+from django.utils import timezone
+from sbxt_accounts import login_history
+from sbxt_accounts.login_history import LoginHistoryBuffer
+from sbxt_accounts.models import CustomAccount, LoginEvent, LoginRollup
+from .test_utils import TestUtils
+
+
+class LoginHistoryTestCase(TestCase):
+    """LoginHistoryTestCase
+
+    TestCase suite for :class:`sbxt_accounts.login_history.LoginHistoryBuffer`
+    and the rollup queries
+
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user: CustomAccount = TestUtils.get_normal_user()
+
+    def setUp(self):
+        self.buffer: LoginHistoryBuffer = LoginHistoryBuffer(
+            shards=4, max_events=10, max_age=60
+        )
+
+    def test_events_are_buffered_until_flush(self):
+        for _ in range(3):
+            self.buffer.record("normie", LoginEvent.LOGIN, session_key="abc")
+        self.assertEqual(len(self.buffer), 3)
+        self.assertFalse(LoginEvent.objects.exists())
+
+        self.assertEqual(self.buffer.flush(), 3)
+        self.assertEqual(len(self.buffer), 0)
+        self.assertEqual(LoginEvent.objects.count(), 3)
+
+    def test_full_buffer_flushes_in_one_batch(self):
+        with self.assertNumQueries(5), self.captureOnCommitCallbacks(execute=True):
+            for i in range(10):
+                self.buffer.record("normie", LoginEvent.LOGIN, session_key=str(i))
+        self.assertEqual(LoginEvent.objects.count(), 10)
+
+    def test_rolled_back_request_keeps_other_events(self):
+        for i in range(9):
+            self.buffer.record("other", LoginEvent.LOGIN, session_key=str(i))
+        with (
+            self.assertRaises(RuntimeError),
+            self.captureOnCommitCallbacks(execute=True),
+        ):
+            with transaction.atomic():
+                self.buffer.record("normie", LoginEvent.LOGIN, session_key="x")
+                raise RuntimeError
+        self.assertEqual(len(self.buffer), 10)
+        self.assertFalse(LoginEvent.objects.exists())
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.buffer.record("normie", LoginEvent.LOGIN, session_key="y")
+        self.assertEqual(LoginEvent.objects.count(), 11)
+
+    def test_failed_flush_puts_events_back(self):
+        self.buffer.record("normie", LoginEvent.LOGIN)
+        self.buffer.record("normie", LoginEvent.LOGOUT)
+        with (
+            mock.patch.object(
+                LoginEvent.objects, "bulk_create", side_effect=DatabaseError
+            ),
+            self.assertRaises(DatabaseError),
+        ):
+            self.buffer.flush()
+        self.assertEqual(len(self.buffer), 2)
+        self.assertEqual(self.buffer.flush(), 2)
+        self.assertEqual(LoginEvent.objects.count(), 2)
+
+    def test_rollups_accumulate_across_flushes(self):
+        yesterday = timezone.now() - timedelta(days=1)
+        self.buffer.record("normie", LoginEvent.LOGIN, timestamp=yesterday)
+        self.buffer.record("normie", LoginEvent.LOGIN)
+        self.buffer.flush()
+        self.buffer.record("normie", LoginEvent.LOGIN)
+        self.buffer.record("normie", LoginEvent.LOGOUT)
+        self.buffer.flush()
+
+        activity = login_history.recent_activity("normie", days=7)
+        self.assertEqual(
+            [(a["logins"], a["logouts"]) for a in activity], [(2, 1), (1, 0)]
+        )
+        self.assertEqual(
+            login_history.activity_totals("normie", days=7),
+            {"logins": 3, "logouts": 1},
+        )
+        self.assertEqual(login_history.activity_totals("nobody_here")["logins"], 0)
+
+    def test_prune_drops_whole_days(self):
+        old = timezone.now() - timedelta(days=100)
+        self.buffer.record("normie", LoginEvent.LOGIN, timestamp=old)
+        self.buffer.record("normie", LoginEvent.LOGIN)
+        self.buffer.flush()
+
+        self.assertEqual(login_history.prune(event_days=90, rollup_days=90), (1, 1))
+        self.assertEqual(LoginEvent.objects.count(), 1)
+        self.assertEqual(LoginRollup.objects.count(), 1)
+
+    def test_login_signal_records_event(self):
+        login_history.buffer.flush()
+        LoginEvent.objects.all().delete()
+        self.client.force_login(self.user)
+        self.client.logout()
+        login_history.buffer.flush()
+        self.assertEqual(
+            sorted(LoginEvent.objects.values_list("action", flat=True)),
+            [LoginEvent.LOGIN, LoginEvent.LOGOUT],
+        )
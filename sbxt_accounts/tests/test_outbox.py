@@ -0,0 +1,152 @@
+"""TestCases for :ref:`sbxt_accounts.outbox`
+
+Run these specific tests with ::
+
+    python manage.py test sbxt_accounts.tests.test_outbox
+
+"""
+
+from datetime import timedelta
+from django.db import transaction
+from django.test import TestCase
+from sbxt_accounts.models import ChangeEvent, CustomAccount, AccountProfile
+from sbxt_accounts.outbox import OutboxConsumer, SQLiteMirror, compact, prune
+from .factories import AccountFactory, ProfileFactory
+
+ACCOUNT: str = "accounts.customaccount"
+PROFILE: str = "accounts.accountprofile"
+
+
+class OutboxTestCase(TestCase):
+    """OutboxTestCase
+
+    TestCase suite for :class:`sbxt_accounts.models.ChangeEvent` and the
+    :mod:`sbxt_accounts.outbox` consumers
+
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.accounts: list[CustomAccount] = AccountFactory.create_batch(3)
+        cls.profiles: list[AccountProfile] = ProfileFactory.create_batch(cls.accounts)
+
+    def test_bulk_create_records_events(self):
+        self.assertEqual(ChangeEvent.objects.filter(model=ACCOUNT).count(), 3)
+        self.assertEqual(ChangeEvent.objects.filter(model=PROFILE).count(), 3)
+
+    def test_payload_excludes_password(self):
+        AccountFactory.create("outboxuser")
+        event = ChangeEvent.objects.latest()
+        self.assertEqual(event.action, ChangeEvent.CREATE)
+        self.assertEqual(event.payload["username"], "outboxuser")
+        self.assertNotIn("password", event.payload)
+
+    def test_rolled_back_change_writes_no_event(self):
+        before = ChangeEvent.objects.count()
+        with self.assertRaises(RuntimeError), transaction.atomic():
+            AccountFactory.create("rolledback")
+            raise RuntimeError
+        self.assertEqual(ChangeEvent.objects.count(), before)
+
+    def test_consumer_reads_batches_from_high_water_mark(self):
+        consumer = OutboxConsumer("test", batch_size=4)
+        seen: list[list[int]] = []
+        self.assertEqual(consumer.consume(lambda b: seen.append([e.id for e in b])), 6)
+        self.assertEqual([len(b) for b in seen], [4, 2])
+
+        self.accounts[0].is_active = False
+        self.accounts[0].save()
+        self.assertEqual([e.action for e in consumer.read()], [ChangeEvent.UPDATE])
+        self.assertEqual(consumer.position, seen[-1][-1])
+
+    def test_consumer_waits_for_ids_that_commit_out_of_order(self):
+        consumer = OutboxConsumer("test")
+        consumer.ack(consumer.read())
+        position = consumer.position
+
+        # id position + 1 is still uncommitted when position + 2 commits
+        late = ChangeEvent.objects.build(self.accounts[0], ChangeEvent.UPDATE)
+        late.id = position + 1
+        early = ChangeEvent.objects.build(self.accounts[1], ChangeEvent.UPDATE)
+        early.id = position + 2
+        early.save()
+        self.assertEqual(consumer.read(), [])
+
+        late.save()
+        self.assertEqual([e.id for e in consumer.read()], [position + 1, position + 2])
+
+    def test_consumer_skips_gaps_older_than_timeout(self):
+        consumer = OutboxConsumer("test", gap_timeout=timedelta(seconds=60))
+        consumer.ack(consumer.read())
+        event = ChangeEvent.objects.build(self.accounts[0], ChangeEvent.UPDATE)
+        event.id = consumer.position + 2
+        event.save()
+        self.assertEqual(consumer.read(), [])
+
+        ChangeEvent.objects.filter(id=event.id).update(
+            created=event.created - timedelta(seconds=61)
+        )
+        self.assertEqual([e.id for e in consumer.read()], [event.id])
+
+    def test_compact_keeps_latest_event_per_object(self):
+        for _ in range(3):
+            self.accounts[1].save()
+        self.assertEqual(compact(), 3)
+        latest = ChangeEvent.objects.get(
+            model=ACCOUNT, object_pk=str(self.accounts[1].pk)
+        )
+        self.assertEqual(latest.action, ChangeEvent.UPDATE)
+
+    def test_prune_keeps_unacknowledged_events(self):
+        consumer = OutboxConsumer("test", batch_size=2)
+        consumer.ack(consumer.read())
+        self.assertEqual(prune(timedelta(0)), 2)
+        self.assertEqual(ChangeEvent.objects.count(), 4)
+
+    def test_prune_without_consumers_deletes_nothing(self):
+        self.assertEqual(prune(timedelta(0)), 0)
+        self.assertEqual(ChangeEvent.objects.count(), 6)
+
+    def test_prune_keeps_events_the_mirror_has_not_applied(self):
+        mirror = SQLiteMirror(":memory:", batch_size=4)
+        mirror.apply(list(ChangeEvent.objects.order_by("id")[:2]))
+        self.assertEqual(prune(timedelta(0)), 2)
+        self.assertEqual(mirror.sync(), 4)
+
+    def test_bulk_create_rejects_conflict_handling(self):
+        for manager, obj in (
+            (CustomAccount.objects, CustomAccount(username="conflict")),
+            (AccountProfile.objects, AccountProfile(user=self.accounts[0])),
+        ):
+            for option in ("ignore_conflicts", "update_conflicts"):
+                with self.assertRaises(ValueError):
+                    manager.bulk_create([obj], **{option: True})
+
+    def test_account_bulk_update_records_events(self):
+        self.accounts[0].is_active = False
+        CustomAccount.objects.bulk_update(self.accounts[:1], ["is_active"])
+        event = ChangeEvent.objects.latest()
+        self.assertEqual(event.action, ChangeEvent.UPDATE)
+        self.assertEqual(event.object_pk, str(self.accounts[0].pk))
+        self.assertEqual(event.payload["is_active"], "False")
+
+    def test_login_writes_no_event(self):
+        AccountFactory.create("loginuser")
+        before = ChangeEvent.objects.count()
+        self.assertTrue(self.client.login(username="loginuser", password="P@55w0rd"))
+        self.assertEqual(ChangeEvent.objects.count(), before)
+
+    def test_sqlite_mirror(self):
+        mirror = SQLiteMirror(":memory:", batch_size=4)
+        self.assertEqual(mirror.sync(), 6)
+        self.assertEqual(mirror.count(ACCOUNT), 3)
+        self.assertEqual(
+            mirror.get(PROFILE, self.accounts[2].username)["email"],
+            "testuser0002@test.dev",
+        )
+
+        self.accounts[2].delete()
+        self.assertEqual(mirror.sync(), 2)
+        self.assertEqual(mirror.count(ACCOUNT), 2)
+        self.assertIsNone(mirror.get(PROFILE, self.accounts[2].username))
+        self.assertEqual(mirror.sync(), 0)
@@ -0,0 +1,132 @@
+"""TestCases for :ref:`sbxt_accounts.password_store`
+
+Run these specific tests with ::
+
+    python manage.py test sbxt_accounts.tests.test_password_store
+
+"""
+
+import tempfile
+import threading
+from django.core.exceptions import ValidationError
+from django.test import SimpleTestCase
+from sbxt_accounts.password_store import PasswordListStore
+from sbxt_accounts.validators import CustomCommonPasswordValidator
+
+
+class PasswordListStoreTestCase(SimpleTestCase):
+    """PasswordListStoreTestCase
+
+    TestCase suite for :class:`sbxt_accounts.password_store.PasswordListStore`
+
+    """
+
+    def setUp(self):
+        """setUp
+
+        Set up a temporary store with a published generation
+        """
+        self.tmp: tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.publisher: PasswordListStore = PasswordListStore(self.tmp.name)
+        self.reader: PasswordListStore = PasswordListStore(
+            self.tmp.name, check_interval=0
+        )
+        self.publisher.publish(["Password", "123456", "qwerty"], shard_count=4)
+
+    def test_empty_store_has_no_passwords(self):
+        with tempfile.TemporaryDirectory() as d:
+            self.assertNotIn("password", PasswordListStore(d).current())
+
+    def test_published_passwords_are_found(self):
+        generation = self.reader.current()
+        self.assertEqual(generation.number, 1)
+        self.assertEqual(len(generation), 3)
+        self.assertIn(" PASSWORD ", generation)
+        self.assertNotIn("c0rrect-h0rse", generation)
+
+    def test_delta_is_picked_up_without_reloading_unchanged_shards(self):
+        first = self.reader.current()
+        self.publisher.publish_delta(add=["letmein"], remove=["qwerty"])
+        second = self.reader.current()
+
+        self.assertEqual(second.number, 2)
+        self.assertIn("letmein", second)
+        self.assertNotIn("qwerty", second)
+        self.assertIn("qwerty", first)
+
+        changed = [
+            i for i, n in enumerate(second.shard_names) if n != first.shard_names[i]
+        ]
+        self.assertLessEqual(len(changed), 2)
+        for i, shard in enumerate(second.shards):
+            if i not in changed:
+                self.assertIs(shard, first.shards[i])
+
+    def test_unchanged_manifest_is_not_reread(self):
+        first = self.reader.current()
+        self.assertIs(self.reader.current(), first)
+
+    def test_prune_keeps_live_shards(self):
+        self.publisher.publish_delta(add=["letmein"])
+        self.publisher.publish_delta(add=["dragon"])
+        self.publisher.prune(keep=1)
+        generation = PasswordListStore(self.tmp.name).current()
+        self.assertIn("dragon", generation)
+        self.assertIn("password", generation)
+
+    def test_shard_pruned_while_loading_rereads_manifest(self):
+        stale = self.publisher.read_manifest()
+        self.publisher.publish_delta(add=["letmein"], remove=["qwerty"])
+        self.publisher.prune(keep=1)
+
+        reads = [stale]
+        read_manifest = self.reader.read_manifest
+        self.reader.read_manifest = lambda: reads.pop() if reads else read_manifest()
+        generation = self.reader.current()
+        self.assertEqual(generation.number, 2)
+        self.assertIn("letmein", generation)
+
+    def test_concurrent_deltas_are_not_lost(self):
+        barrier = threading.Barrier(4)
+
+        def publish(word):
+            barrier.wait()
+            PasswordListStore(self.tmp.name).publish_delta(add=[word])
+
+        words = ["letmein", "dragon", "monkey", "sunshine"]
+        threads = [threading.Thread(target=publish, args=(w,)) for w in words]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        generation = self.reader.current()
+        self.assertEqual(generation.number, 5)
+        for word in words:
+            self.assertIn(word, generation)
+
+
+class CustomCommonPasswordValidatorTestCase(SimpleTestCase):
+    """CustomCommonPasswordValidatorTestCase
+
+    TestCase suite for
+    :class:`sbxt_accounts.validators.CustomCommonPasswordValidator`
+    backed by a password list store
+
+    """
+
+    def setUp(self):
+        self.tmp: tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        PasswordListStore(self.tmp.name).publish(["password"])
+        self.validator: CustomCommonPasswordValidator = CustomCommonPasswordValidator(
+            password_store=self.tmp.name
+        )
+
+    def test_common_password_raises_ValidationError(self):
+        with self.assertRaises(ValidationError):
+            self.validator.validate("Password")
+
+    def test_uncommon_password_passes(self):
+        self.assertIsNone(self.validator.validate("c0rrect-h0rse"))
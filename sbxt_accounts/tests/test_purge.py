@@ -0,0 +1,165 @@
+"""TestCases for :ref:`sbxt_accounts.purge`
+
+Run these specific tests with ::
+
+    python manage.py test sbxt_accounts.tests.test_purge
+
+"""
+
+import gzip
+import json
+import os
+import tempfile
+from datetime import timedelta
+from django.contrib.auth.models import Group, Permission
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from sbxt_accounts.login_history import LoginHistoryBuffer
+from sbxt_accounts.models import (
+    AccountProfile,
+    ArchivedAccount,
+    ChangeEvent,
+    CustomAccount,
+    LoginEvent,
+)
+from sbxt_accounts.purge import PurgeEngine, PurgeReport, read_archive_file
+from .factories import AccountFactory, ProfileFactory
+
+MEDIA_ROOT: str = tempfile.mkdtemp()
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT)
+class PurgeEngineTestCase(TestCase):
+    """PurgeEngineTestCase
+
+    TestCase suite for :class:`sbxt_accounts.purge.PurgeEngine`
+
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        old = timezone.now() - timedelta(days=400)
+        cls.closed: list[CustomAccount] = AccountFactory.create_batch(
+            5, prefix="closeduser", is_active=False, date_joined=old
+        )
+        AccountFactory.create("activeuser", date_joined=old)
+        AccountFactory.create("recentclosed", is_active=False)
+        ProfileFactory.create_batch(cls.closed[:2])
+
+        cls.group: Group = Group.objects.create(name="members")
+        cls.closed[0].groups.add(cls.group)
+        cls.closed[0].user_permissions.add(Permission.objects.first())
+
+        history = LoginHistoryBuffer()
+        history.record("closeduser0000", LoginEvent.LOGIN, timestamp=old)
+        history.record("activeuser", LoginEvent.LOGIN, timestamp=old)
+        history.flush()
+
+    def setUp(self):
+        self.pic: str = default_storage.save("users/profile/pic.png", ContentFile(b"x"))
+        AccountProfile.objects.filter(pk=self.closed[1].username).update(
+            profile_pic=self.pic
+        )
+
+    def test_dry_run_changes_nothing(self):
+        report = PurgeEngine(inactive_days=365, batch_size=2, dry_run=True).run()
+        self.assertEqual(report.accounts, 5)
+        self.assertEqual(report.profiles, 2)
+        self.assertEqual(report.group_links, 1)
+        self.assertEqual(report.permission_links, 1)
+        self.assertEqual(report.media_files, 1)
+        self.assertEqual(report.login_history, 2)
+        self.assertEqual(report.batches, 3)
+        self.assertEqual(CustomAccount.objects.count(), 7)
+
+    def test_run_archives_and_deletes_in_batches(self):
+        seen: list[int] = []
+        engine = PurgeEngine(
+            inactive_days=365,
+            batch_size=2,
+            pause=0,
+            progress=lambda r: seen.append(r.accounts),
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            report = engine.run()
+
+        self.assertEqual(seen, [2, 4, 5])
+        self.assertEqual(report.accounts, 5)
+        self.assertEqual(report.profiles, 2)
+        self.assertEqual(
+            sorted(CustomAccount.objects.values_list("username", flat=True)),
+            ["activeuser", "recentclosed"],
+        )
+        self.assertFalse(AccountProfile.objects.exists())
+        self.assertEqual(report.login_history, 2)
+        self.assertEqual(
+            list(LoginEvent.objects.values_list("username", flat=True)),
+            ["activeuser"],
+        )
+        self.assertFalse(os.path.exists(os.path.join(MEDIA_ROOT, self.pic)))
+
+        archived = ArchivedAccount.objects.get(username="closeduser0000")
+        self.assertEqual(archived.groups, ["members"])
+        self.assertEqual(len(archived.permissions), 1)
+        self.assertEqual(archived.profile["email"], "closeduser0000@test.dev")
+        self.assertNotIn("password", archived.account)
+
+    def test_archive_file(self):
+        with tempfile.TemporaryDirectory() as d:
+            path = os.path.join(d, "archive.jsonl.gz")
+            PurgeEngine(inactive_days=365, pause=0, archive_file=path).run()
+            with gzip.open(path, "rt") as f:
+                records = [json.loads(line) for line in f]
+            # a rolled back batch is archived again by the next run
+            with gzip.open(path, "at") as f:
+                f.write(json.dumps(records[0]) + "\n")
+            self.assertEqual(len(read_archive_file(path)), 5)
+        self.assertEqual(len(records), 5)
+        self.assertFalse(ArchivedAccount.objects.exists())
+
+    def test_failed_archive_file_write_keeps_accounts(self):
+        engine = PurgeEngine(
+            inactive_days=365, pause=0, archive_file="/nonexistent/archive.gz"
+        )
+        with self.assertRaises(OSError):
+            engine.run()
+        self.assertEqual(CustomAccount.objects.count(), 7)
+
+    def test_batch_rechecks_candidates(self):
+        engine = PurgeEngine(inactive_days=365, pause=0)
+        ids = list(engine.candidates().values_list("pk", flat=True))
+        CustomAccount.objects.filter(pk=self.closed[0].pk).update(
+            is_active=True, last_login=timezone.now()
+        )
+        report = PurgeReport(len(ids))
+        engine._purge_batch(ids, report)
+        self.assertEqual(report.accounts, 4)
+        self.assertTrue(CustomAccount.objects.filter(pk=self.closed[0].pk).exists())
+        self.assertTrue(
+            AccountProfile.objects.filter(pk=self.closed[0].username).exists()
+        )
+
+    def test_batch_deletes_are_set_based(self):
+        engine = PurgeEngine(inactive_days=365, batch_size=5, pause=0)
+        report = PurgeReport(5)
+        ids = list(engine.candidates().values_list("pk", flat=True))
+        with self.assertNumQueries(17):
+            engine._purge_batch(ids, report)
+        self.assertEqual(report.accounts, 5)
+        self.assertEqual(
+            ChangeEvent.objects.filter(action=ChangeEvent.DELETE).count(), 7
+        )
+
+        more = AccountFactory.create_batch(
+            40,
+            prefix="bigbatch",
+            is_active=False,
+            date_joined=timezone.now() - timedelta(days=400),
+        )
+        ProfileFactory.create_batch(more)
+        ids = list(engine.candidates().values_list("pk", flat=True))
+        with self.assertNumQueries(17):
+            engine._purge_batch(ids, report)
+        self.assertEqual(report.accounts, 45)
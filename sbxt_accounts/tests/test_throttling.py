@@ -0,0 +1,108 @@
+"""TestCases for :ref:`sbxt_accounts.throttling`
+
+Run these specific tests with ::
+
+    python manage.py test sbxt_accounts.tests.test_throttling
+
+"""
+
+import threading
+import warnings
+from django.contrib.auth import authenticate
+from django.core.cache import cache
+from django.core.cache.backends.base import CacheKeyWarning
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+from sbxt_accounts.middleware import LoginThrottleMiddleware
+from sbxt_accounts.models import CustomAccount
+from sbxt_accounts.throttling import SlidingWindow
+from .test_utils import TestUtils
+
+
+@override_settings(
+    AUTHENTICATION_BACKENDS=["sbxt_accounts.backends.ThrottledModelBackend"],
+    LOGIN_THROTTLE_RATES={"username": (3, 300), "ip": (5, 60)},
+    LOGIN_THROTTLE_PATHS=["/login/"],
+)
+class LoginThrottleTestCase(TestCase):
+    """LoginThrottleTestCase
+
+    TestCase suite for :class:`sbxt_accounts.backends.ThrottledModelBackend`
+    and :class:`sbxt_accounts.middleware.LoginThrottleMiddleware`
+
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user: CustomAccount = TestUtils.get_normal_user()
+
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.factory: RequestFactory = RequestFactory()
+
+    def test_window_fills_and_reports_retry_after(self):
+        window = SlidingWindow("username", "normie")
+        self.assertEqual([window.consume() for _ in range(4)], [True] * 3 + [False])
+        self.assertGreater(window.retry_after(), 0)
+
+    def test_concurrent_attempts_do_not_share_a_stale_count(self):
+        window = SlidingWindow("username", "normie")
+        barrier = threading.Barrier(12)
+        results: list[bool] = []
+
+        def attempt():
+            barrier.wait()
+            results.append(window.consume())
+
+        threads = [threading.Thread(target=attempt) for _ in range(12)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertLessEqual(results.count(True), 3)
+
+    def test_odd_usernames_make_valid_cache_keys(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", CacheKeyWarning)
+            self.assertTrue(SlidingWindow("username", "x y\n" * 200).consume())
+
+    def test_valid_login(self):
+        self.assertEqual(
+            authenticate(
+                self.factory.post("/login/"), username="Normie", password="P@55w0rd"
+            ),
+            self.user,
+        )
+
+    def test_successful_logins_are_not_counted(self):
+        for _ in range(6):
+            self.assertEqual(
+                authenticate(None, username="normie", password="P@55w0rd"),
+                self.user,
+            )
+        self.assertIsNone(authenticate(None, username="normie", password="wrong"))
+
+    def test_username_is_throttled_before_hashing(self):
+        request = self.factory.post("/login/")
+        for _ in range(3):
+            self.assertIsNone(
+                authenticate(request, username="normie", password="wrong")
+            )
+        with self.assertNumQueries(0):
+            self.assertIsNone(
+                authenticate(request, username="normie", password="P@55w0rd")
+            )
+
+    def test_unknown_and_known_usernames_cost_the_same(self):
+        for _ in range(3):
+            authenticate(None, username="nobody_here", password="wrong")
+            authenticate(None, username="normie", password="wrong")
+        self.assertFalse(SlidingWindow("username", "nobody_here").consume())
+        self.assertFalse(SlidingWindow("username", "normie").consume())
+
+    def test_middleware_returns_429(self):
+        middleware = LoginThrottleMiddleware(lambda r: HttpResponse("ok"))
+        codes = [middleware(self.factory.post("/login/")).status_code for _ in range(6)]
+        self.assertEqual(codes, [200] * 5 + [429])
+        self.assertEqual(middleware(self.factory.get("/login/")).status_code, 200)
@@ -1,7 +1,12 @@
 """sbxt_accounts/utils/test_utils.py
 
-    Utilities for "class"`django.test.TestCase` tests required to test
-    :ref:`sbxt_accounts.models.CustomAccount`
+Utilities for "class"`django.test.TestCase` tests required to test
+:ref:`sbxt_accounts.models.CustomAccount`
+
+The users are created through the ``CustomAccount.objects`` manager
+methods so the tests built on them exercise ``create_user`` and
+``create_superuser``. Bulk data comes from
+:mod:`sbxt_accounts.tests.factories` instead.
 
 """
 
@@ -32,6 +37,8 @@ class TestUtils:
             is_staff=True,
         )
 
+        return su
+
     def get_normal_user(
         u: Optional[str] = "normie",
         p: Optional[str] = "P@55w0rd",
@@ -40,3 +47,5 @@ class TestUtils:
             username=u,
             password=p,
         )
+
+        return nu
@@ -0,0 +1,12 @@
+"""sbxt_accounts/tests/urls.py
+
+URLs for tests that need the admin site
+
+"""
+
+from django.contrib import admin
+from django.urls import path
+
+urlpatterns = [
+    path("admin/", admin.site.urls),
+]
@@ -0,0 +1,199 @@
+"""accounts/throttling.py
+
+Sliding window throttling for login and signup requests.
+
+Counters live in Django's cache so every worker shares them. Rates are
+configured with ``(capacity, period_in_seconds)`` pairs in settings::
+
+    LOGIN_THROTTLE_RATES: dict[str, tuple[int, int]] = {
+        "username": (5, 300),
+        "ip": (20, 60),
+    }
+    LOGIN_THROTTLE_CACHE: str = "default"
+    LOGIN_THROTTLE_PATHS: list[str] = ["/accounts/login/", "/accounts/signup/"]
+"""
+
+import hashlib
+import math
+import time
+from typing import Optional
+from django.conf import settings
+from django.core.cache import BaseCache, caches
+from django.http import HttpRequest
+
+DEFAULT_RATES: dict[str, tuple[int, int]] = {
+    "username": (5, 300),
+    "ip": (20, 60),
+}  #: default (capacity, period) for each scope
+KEY_PREFIX: str = "sbxt_accounts:throttle"  #: cache key prefix
+
+
+def get_rate(scope: str) -> tuple[int, int]:
+    """get_rate
+
+    Args:
+        scope (str): limit scope, ``"username"`` or ``"ip"``
+
+    Returns:
+        tuple[int, int]: (capacity, period) for `scope`
+    """
+    rates: dict = getattr(settings, "LOGIN_THROTTLE_RATES", {})
+    return tuple(rates.get(scope, DEFAULT_RATES[scope]))
+
+
+def get_throttle_cache() -> BaseCache:
+    """get_throttle_cache
+
+    Returns:
+        BaseCache: the cache named by `LOGIN_THROTTLE_CACHE`
+    """
+    return caches[getattr(settings, "LOGIN_THROTTLE_CACHE", "default")]
+
+
+def get_client_ip(request: HttpRequest) -> Optional[str]:
+    """get_client_ip
+
+    Uses the first ``X-Forwarded-For`` address when
+    `LOGIN_THROTTLE_TRUST_X_FORWARDED_FOR` is set, ``REMOTE_ADDR`` otherwise.
+
+    Args:
+        request (HttpRequest): the current request
+
+    Returns:
+        str | None: the client's address
+    """
+    if getattr(settings, "LOGIN_THROTTLE_TRUST_X_FORWARDED_FOR", False):
+        forwarded: str = request.META.get("HTTP_X_FORWARDED_FOR", "")
+        if forwarded:
+            return forwarded.split(",")[0].strip()
+    return request.META.get("REMOTE_ADDR")
+
+
+class SlidingWindow:
+    """SlidingWindow
+
+    A sliding window rate limit kept in the cache as one counter per
+    `period` long window.
+
+    Counters are only changed with ``cache.add`` and ``cache.incr``, which
+    are atomic on the shared cache backends, so concurrent workers can not
+    all read the same count and all let a request through. The number of
+    requests in the last `period` seconds is estimated as the current
+    window's count plus the previous window's count weighted by how much of
+    it still overlaps.
+
+    Args:
+        scope (str): limit scope, used for the rate and the cache key
+        ident (str): the username or address being throttled, hashed into
+            the cache key so any value makes a valid key
+        cache (BaseCache | None): cache to use, defaults to
+            :func:`get_throttle_cache`
+    """
+
+    def __init__(
+        self,
+        scope: str,
+        ident: str,
+        cache: Optional[BaseCache] = None,
+    ) -> None:
+        self.capacity, self.period = get_rate(scope)
+        digest: str = hashlib.sha256(ident.encode("utf-8")).hexdigest()
+        self.key: str = f"{KEY_PREFIX}:{scope}:{digest}"
+        self.cache: BaseCache = cache or get_throttle_cache()
+        self._charged: Optional[str] = None  #: counter of the last consume
+
+    def _window(self, now: float) -> tuple[int, float]:
+        """index of the window holding `now` and how far into it `now` is"""
+        window, offset = divmod(now, self.period)
+        return int(window), offset / self.period
+
+    def _key(self, window: int) -> str:
+        return f"{self.key}:{window}"
+
+    def _incr(self, key: str, delta: int) -> int:
+        timeout: int = 2 * math.ceil(self.period) + 1
+        while True:
+            if self.cache.add(key, delta, timeout=timeout):
+                return delta
+            try:
+                return self.cache.incr(key, delta)
+            except ValueError:
+                # expired between add and incr
+                continue
+
+    def _estimate(self, window: int, elapsed: float, current: int) -> float:
+        previous: int = self.cache.get(self._key(window - 1), 0)
+        return previous * (1 - elapsed) + current
+
+    def consume(self, count: int = 1) -> bool:
+        """consume
+
+        Counts `count` requests if that keeps the window within its
+        capacity. Requests that are refused are not counted.
+
+        Args:
+            count (int): requests to count
+
+        Returns:
+            bool: `True` if the requests were counted
+        """
+        window, elapsed = self._window(time.time())
+        key: str = self._key(window)
+        current: int = self._incr(key, count)
+        if self._estimate(window, elapsed, current) <= self.capacity:
+            self._charged = key
+            return True
+        try:
+            self.cache.decr(key, count)
+        except ValueError:
+            pass
+        return False
+
+    def refund(self, count: int = 1) -> None:
+        """refund
+
+        Takes back `count` requests counted by the last :meth:`consume`,
+        for example once a login attempt turns out to be successful.
+
+        Args:
+            count (int): requests to take back
+        """
+        if self._charged is None:
+            return
+        try:
+            self.cache.decr(self._charged, count)
+        except ValueError:
+            # the window already expired
+            pass
+        self._charged = None
+
+    def retry_after(self, count: int = 1) -> int:
+        """retry_after
+
+        Args:
+            count (int): requests the next attempt needs
+
+        Returns:
+            int: seconds until `count` requests would be allowed
+        """
+        now: float = time.time()
+        window, elapsed = self._window(now)
+        current: int = self.cache.get(self._key(window), 0)
+        previous: int = self.cache.get(self._key(window - 1), 0)
+        if previous * (1 - elapsed) + current + count <= self.capacity:
+            return 0
+        if current + count <= self.capacity:
+            # wait for the previous window to slide out far enough
+            needed: float = 1 - (self.capacity - current - count) / previous
+            return max(0, math.ceil((needed - elapsed) * self.period))
+        # wait for the next window, then for this one to slide out
+        needed: float = 1 - (self.capacity - count) / current if current else 0
+        return math.ceil((1 - elapsed + max(0.0, needed)) * self.period)
+
+    def reset(self) -> None:
+        """reset
+
+        Clears the counters
+        """
+        window, _ = self._window(time.time())
+        self.cache.delete_many([self._key(window), self._key(window - 1)])
@@ -1,10 +1,13 @@
 # accounts/utils/__init__.py
 
-from model_utils import (
+from .model_utils import (
     get_bool,
     normalize_username,
     user_profile_media,
     format_name,
+    canonical_email,
+    normalize_phone,
+    normalize_contacts,
 )
 
 modules: list[str] = [
@@ -12,6 +15,9 @@ modules: list[str] = [
     normalize_username.__doc__,
     user_profile_media.__doc__,
     format_name.__doc__,
+    canonical_email.__doc__,
+    normalize_phone.__doc__,
+    normalize_contacts.__doc__,
 ]  #: a list of docstrings for each imported model
 
 __doc__: str = str("\n".join(modules))
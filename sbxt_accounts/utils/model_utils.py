@@ -3,7 +3,8 @@
 Utilities designed to assist with sbxt_accounts models
 """
 
-from typing import Optional
+from typing import Iterable, Optional
+from phonenumber_field.phonenumber import PhoneNumber, to_python
 
 
 def get_bool(v: bool, alt: Optional[tuple[str, str]] = ("active", "inactive")) -> str:
@@ -90,3 +91,89 @@ def format_name(n: str) -> str:
     formatted_n: str = "".join([n.upper()[0], n[1:]])
 
     return formatted_n
+
+
+def canonical_email(email: Optional[str]) -> str:
+    """canonical_email(email: str) -> str
+
+    Lowercases an email address and drops any ``+tag`` from the local part
+    so addresses that reach the same mailbox compare equal.
+
+    Args:
+        email (str | None): an email address
+
+    Returns:
+        str: the canonical address, ``""`` for an empty value
+
+    Example::
+
+        >>> from sbxt_accounts.utils import canonical_email
+        >>> canonical_email(" Normie+News@Test.dev ")
+        "normie@test.dev"
+
+    """
+
+    if not email:
+        return ""
+    local, at, domain = email.strip().lower().rpartition("@")
+    if not at:
+        return domain
+    return f"{local.split('+', 1)[0]}@{domain}"
+
+
+def normalize_phone(phone, region: Optional[str] = None) -> str:
+    """normalize_phone(phone, region: str | None = None) -> str
+
+    Formats a phone number as E.164.
+
+    Args:
+        phone (PhoneNumber | str | None): the phone number
+        region (str | None): region used to parse numbers without a
+            country code
+
+    Returns:
+        str: the E.164 number, ``""`` for an empty or invalid value
+
+    Example::
+
+        >>> from sbxt_accounts.utils import normalize_phone
+        >>> normalize_phone("+1 (804) 444-8888")
+        "+18044448888"
+
+    """
+
+    if not phone:
+        return ""
+    if not isinstance(phone, PhoneNumber):
+        phone = to_python(str(phone), region=region)
+    return phone.as_e164 if phone.is_valid() else ""
+
+
+def normalize_contacts(profiles: Iterable, region: Optional[str] = None) -> list:
+    """normalize_contacts(profiles, region: str | None = None) -> list
+
+    Fills ``phone_e164`` and ``email_canonical`` for a batch of profiles.
+    Each distinct phone number and email address in the batch is only
+    normalized once.
+
+    Args:
+        profiles (Iterable[AccountProfile]): profiles to update in place
+        region (str | None): region used to parse numbers without a
+            country code
+
+    Returns:
+        list[AccountProfile]: the profiles
+    """
+
+    profiles: list = list(profiles)
+    phones: dict[str, str] = {}
+    emails: dict[str, str] = {}
+    for p in profiles:
+        raw_phone: str = str(p.phone or "")
+        if raw_phone not in phones:
+            phones[raw_phone] = normalize_phone(p.phone, region=region)
+        if p.email not in emails:
+            emails[p.email] = canonical_email(p.email)
+        p.phone_e164 = phones[raw_phone]
+        p.email_canonical = emails[p.email]
+    return profiles
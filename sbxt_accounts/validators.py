@@ -4,12 +4,14 @@ import re
 
 from dateutil.relativedelta import relativedelta as rtimed
 from datetime import datetime
+from typing import Optional
 from django.conf import settings
 from django.contrib.auth.password_validation import CommonPasswordValidator
 from django.core.exceptions import ValidationError
 from django.core.validators import RegexValidator
 from django.utils.deconstruct import deconstructible
 from django.utils.translation import gettext_lazy as _
+from sbxt_accounts.password_store import PasswordListStore, get_password_store
 
 
 def validate_age(age: datetime.date) -> None:
@@ -69,6 +71,17 @@ class CustomCommonPasswordValidator(CommonPasswordValidator):
 
     Checks the users password against a list of commonly used passwords
 
+    The list is read from `COMMON_PASSWORDS_LIST` when the validator is
+    created. If `COMMON_PASSWORDS_STORE` is set (or `password_store` is
+    passed in the validator's `OPTIONS`) the list is read from a
+    :class:`sbxt_accounts.password_store.PasswordListStore` instead, so
+    newly published generations are picked up without a restart.
+
+    Args:
+
+        password_list_path (str | None): path to a password list
+        password_store (str | None): path to a password list store
+
     Raises:
 
         ValidationError: the password matched a common password
@@ -79,4 +92,45 @@ class CustomCommonPasswordValidator(CommonPasswordValidator):
 
     """
 
-    DEFAULT_PASSWORD_LIST_PATH: str = settings.COMMON_PASSWORDS_LIST
+    DEFAULT_PASSWORD_LIST_PATH: str = getattr(
+        settings,
+        "COMMON_PASSWORDS_LIST",
+        CommonPasswordValidator.DEFAULT_PASSWORD_LIST_PATH,
+    )
+
+    def __init__(
+        self,
+        password_list_path: Optional[str] = None,
+        password_store: Optional[str] = None,
+    ) -> None:
+        if password_store is None:
+            password_store = getattr(settings, "COMMON_PASSWORDS_STORE", None)
+
+        self.store: Optional[PasswordListStore] = None
+        if password_store:
+            self.store = get_password_store(
+                password_store,
+                check_interval=getattr(
+                    settings, "COMMON_PASSWORDS_STORE_CHECK_INTERVAL", 1.0
+                ),
+            )
+        else:
+            super().__init__(password_list_path or self.DEFAULT_PASSWORD_LIST_PATH)
+
+    def validate(self, password: str, user=None) -> None:
+        """validate
+
+        Args:
+            password (str): the password to check
+            user (CustomAccount | None): the user the password belongs to
+
+        Raises:
+            ValidationError: the password matched a common password
+        """
+        if self.store is None:
+            return super().validate(password, user=user)
+        if password in self.store.current():
+            raise ValidationError(
+                _("This password is too common."),
+                code="password_too_common",
+            )